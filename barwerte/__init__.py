@@ -26,8 +26,8 @@ from .sterbetafel import Sterbetafel
 # Grundfunktionen
 from .basisfunktionen import (
     diskont,
-    npx,
-    nqx,
+    npx_val as npx,     # Skalare n-jahrige Ueberlebenswahrscheinlichkeit
+    nqx_val as nqx,     # Skalare n-jahrige Sterbewahrscheinlichkeit
     abzugsglied
 )
 
@@ -37,18 +37,25 @@ from .rentenbarwerte import (
     ae_x_k,         # Lebenslanger Rentenbarwert mit k Zahlungen pro Jahr
     ae_xn,          # Rentenbarwert mit Dauer n
     ae_xn_k,        # Rentenbarwert mit Dauer n mit k Zahlungen pro Jahr
+    ae_xn_k_batch   # ae_x:n^(k) fuer einen Bestand von (Alter, Laufzeit)-Paaren
 )
 
 # Leistungsbarwerte 
 from .leistungsbarwerte import (
     nAe_x,          # Leistungsbarwert Todesfallleistung
     nE_x,           # Leistungsbarwert Erlebensfallleistung
-    Ae_xn           # Leistungsbarwert gemischte Versicherung
+    Ae_xn,          # Leistungsbarwert gemischte Versicherung
+    nAe_x_portfolio, # Verlaufswerte nAe_x fuer einen Bestand von Eintrittsaltern
+    nAe_x_batch,    # |nAx fuer einen Bestand von Eintrittsaltern
+    nE_x_gecacht,   # Gecachte, schreibgeschuetzte Varianten fuer wiederholte Abfragen
+    nAe_x_gecacht,
+    Ae_xn_gecacht
 )
 
 # Finanzmathematik
 from .finanzmathematik import (
-    ag_k
+    ag_k,
+    ag_k_vec        # Vektorisiert ueber Laufzeiten (und Zinssaetze)
 )
 
 # Public API
@@ -70,12 +77,19 @@ __all__ = [
     'ae_x_k',
     'ae_xn',
     'ae_xn_k',
+    'ae_xn_k_batch',
     
     # Leistungsbarwerte
     'nAe_x',
     'nE_x',
     'Ae_xn',
+    'nAe_x_portfolio',
+    'nAe_x_batch',
+    'nE_x_gecacht',
+    'nAe_x_gecacht',
+    'Ae_xn_gecacht',
     
     # Finanzmathematik
     'ag_k',
+    'ag_k_vec',
 ]
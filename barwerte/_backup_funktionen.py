@@ -1,11 +1,75 @@
 
+import hashlib
+import os
+import tempfile
+import threading
+import zipfile
 import numpy as np
-import pandas as pd
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Union, Optional
 
 from .sterbetafel import Sterbetafel, MAX_ALTER
-from .basisfunktionen import diskont, diskont_vec, abzugsglied, npx_val, tpx_matrix
+from .basisfunktionen import (diskont, abzugsglied, npx_val, tpx_matrix, _v_pow_tabelle,
+                              _kpx_abschnittsweise, _abschnitts_enden)
+from ._jit import njit, NUMBA_VERFUEGBAR
+
+
+
+# =======================================================================================================================
+# Rechenkerne fuer die skalaren Funktionen
+# =======================================================================================================================
+
+@njit(cache=True, fastmath=True)
+def _nAe_x_kernel_nb(qx_vec: np.ndarray, v: float) -> float:
+    """
+    Kern fuer |nAx = sum_{t=1}^{n} [(t-1)px * qx+t-1 * v^t].
+    
+    Akkumulator-Form ohne v**t, damit Numba die Schleife optimieren kann.
+    """
+    barwert = 0.0
+    tpx = 1.0  # 0px = 1
+    v_t = v    # v^1
+    
+    for t in range(qx_vec.shape[0]):
+        barwert += tpx * qx_vec[t] * v_t
+        v_t *= v
+        tpx *= (1.0 - qx_vec[t])
+    
+    return barwert
+
+def _nAe_x_kernel_np(qx_vec: np.ndarray, v: float) -> float:
+    """NumPy-Variante von _nAe_x_kernel_nb (ohne Numba)."""
+    n = qx_vec.shape[0]
+    
+    # (t-1)px fuer t = 1..n
+    tpx = np.empty(n, dtype=float)
+    tpx[0] = 1.0
+    np.cumprod(1.0 - qx_vec[:n - 1], out=tpx[1:])
+    
+    # v^1..v^n durch fortgesetzte Multiplikation statt Potenzen
+    return float((tpx * qx_vec) @ np.multiply.accumulate(np.full(n, v)))
+
+@njit(cache=True, fastmath=True)
+def _ae_xn_k_tabelle_nb(qx_vec: np.ndarray, v_pow: np.ndarray, abzug: float, n_px: float) -> float:
+    """
+    Kern fuer ae_x:n^(k) mit vorberechneten v^t-Werten und Abzugsglied.
+    
+    Laufzeit n = len(qx_vec); v_pow ist die gecachte v^t-Tabelle (mindestens
+    n+1 Eintraege), abzug das gecachte Abzugsglied. Da beide Argumente sind (keine
+    eingebetteten Konstanten), wird der Kern nur einmal kompiliert und ueber
+    cache=True auf der Festplatte abgelegt; neue Prozesse laden ihn ohne JIT.
+    """
+    n = qx_vec.shape[0]
+    barwert = 0.0
+    tpx = 1.0  # 0px = 1
+    for t in range(n):
+        barwert += tpx * v_pow[t]
+        tpx *= (1.0 - qx_vec[t])
+    return barwert - abzug * (1.0 - n_px * v_pow[n])
+
+# Ohne Numba sind die vektorisierten NumPy-Varianten schneller als die Schleifen
+_nAe_x_kernel = _nAe_x_kernel_nb if NUMBA_VERFUEGBAR else _nAe_x_kernel_np
 
 
 
@@ -37,48 +101,26 @@ def ae_x_k_val(alter: int, sex: str, zins: float, zw: int, sterbetafel_obj: Ster
         return 0.0
     
     n = MAX_ALTER - alter
-    v = diskont(zins)  
 
     # Alle qx-Werte auf einmal holen
     qx_vec = sterbetafel_obj.qx_vec(alter, n, sex)
 
-    barwert = 0.0
-    tpx = 1.0  # 0px = 1
-    
-    for t in range(n):
-        barwert += tpx * (v ** t)
-        
-        if t < n - 1:
-            tpx *= (1.0 - qx_vec[t])
-    
-    abzug = abzugsglied(zw, zins)
-
-    return barwert - abzug
+    # Lebenslang: Ueberleben bis MAX_ALTER ausgeschlossen (npx = 0)
+    return _ae_xn_k_tabelle_nb(qx_vec, _v_pow_tabelle(zins), abzugsglied(zw, zins), 0.0)
 
 def ae_xn_k_val(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel) -> float:
     if zw <= 0 or n <= 0 or alter + n > MAX_ALTER:
         return 0.0
     
     n = min(MAX_ALTER - alter, n)
-    v = diskont(zins)    
 
     # Alle qx-Werte auf einmal holen
     qx_vec = sterbetafel_obj.qx_vec(alter, n, sex)
-
-    barwert = 0.0
-    tpx = 1.0  # 0px = 1
-    
-    for t in range(n):
-        barwert += tpx * (v ** t)
-        
-        if t < n - 1:
-            tpx *= (1.0 - qx_vec[t])
     
-    abzug = abzugsglied(zw, zins)
     n_px = npx_val(alter, n, sex, sterbetafel_obj)
     
-    return barwert - abzug * (1.0 - n_px * (v ** n))
-
+    # v^t-Tabelle und Abzugsglied kommen aus ihren Caches, der Kern ist einmal kompiliert
+    return _ae_xn_k_tabelle_nb(qx_vec, _v_pow_tabelle(zins), abzugsglied(zw, zins), n_px)
 
 # Vektorisierte Funktionen - nicht optimierte Umsetzung
 def ae_xn_vec(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel) -> np.ndarray:
@@ -120,44 +162,37 @@ def ae_xn_vec(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_ob
     # Begrenze auf MAX_ALTER
     n = min(MAX_ALTER - alter, n)
     
-    # Alle tpx-Werte fuer x, x+1, ..., x+n
-    # Wir brauchen tpx fuer jedes Startalter x+t und Restlaufzeit n-t
+    # Alle tpx-Werte fuer x, x+1, ..., x+n als Slice des tpx-Caches der Tafel
+    tpx_full = tpx_matrix(alter, n, sex, sterbetafel_obj)
     
-    # Initialisiere Ergebnis-Array
-    rentenbarwerte = np.zeros(n, dtype=float)
+    # Diskontierte Ueberlebenswahrscheinlichkeiten tpx * v^t
+    v_pow = _v_pow_tabelle(zins)[:n + 1]
+    disc_surv = tpx_full * v_pow
     
-    # Diskontierungsfaktor
-    v = diskont(zins)
+    # Reverse-kumulative Summe: suffix[t] = sum_{s=t}^{n-1} [spx * v^s]
+    suffix = np.cumsum(disc_surv[n - 1::-1])[::-1]
     
-    # Fuer jedes Startalter x+t berechne ae_{x+t}:n-t
-    for t in range(n):
-        alter_t = alter + t
-        restlaufzeit = n - t
-        
-        # Hole tpx-Werte fuer dieses Startalter
-        tpx_t = tpx_matrix(alter_t, restlaufzeit, sex, sterbetafel_obj)
-        
-        # Berechne v^0, v^1, ..., v^(n-t-1)
-        s_array = np.arange(restlaufzeit)
-        v_s = v ** s_array
-        
-        # Rentenbarwert: sum_{s=0}^{restlaufzeit-1} [tpx_t[s] * v^s]
-        rentenbarwerte[t] = np.sum(tpx_t[:restlaufzeit] * v_s)
+    # Nutzt die Eigenschaft: sp_{x+t} * v^s = (t+s)p_x * v^(t+s) / (tp_x * v^t)
+    # Division nur moeglich, solange tp_x > 0 (tpx ist monoton fallend)
+    k0 = int(np.count_nonzero(tpx_full[:n]))
+    rentenbarwerte = np.zeros(n, dtype=float)
+    rentenbarwerte[:k0] = suffix[:k0] / disc_surv[:k0]
     
     if zw > 1:
         abzug = abzugsglied(zw, zins)
         
-        # Fuer jedes t berechne Korrekturterm: abzug * [1 - (n-t)px * v^(n-t)]
-        for t in range(n):
-            alter_t = alter + t
-            restlaufzeit = n - t
-            
-            # (n-t)px
-            n_t_px = npx_val(alter_t, restlaufzeit, sex, sterbetafel_obj)
-            
-            # Abzugsglied-Korrektur
-            korrektur = abzug * (1.0 - n_t_px * (v ** restlaufzeit))
-            rentenbarwerte[t] -= korrektur
+        # (n-t)p_{x+t} = np_x / tp_x  (npx_val liefert 1.0, sobald x+n MAX_ALTER erreicht)
+        if alter + n >= MAX_ALTER:
+            n_t_px = np.ones(k0, dtype=float)
+        else:
+            n_t_px = tpx_full[n] / tpx_full[:k0]
+        
+        # Abzugsglied-Korrektur: abzug * [1 - (n-t)px * v^(n-t)]
+        rentenbarwerte[:k0] -= abzug * (1.0 - n_t_px * v_pow[n:n - k0:-1])
+    
+    # Ab tp_x = 0 neu ab Alter x+k0 aufsetzen
+    if k0 < n:
+        rentenbarwerte[k0:] = ae_xn_vec(alter + k0, n - k0, sex, zins, zw, sterbetafel_obj)
     
     return rentenbarwerte
 
@@ -186,17 +221,10 @@ def nAe_x_val(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbe
     n = min(MAX_ALTER - alter, n)
     v = diskont(zins)
     
-    barwert = 0.0
-    tpx = 1.0  # 0px = 1
-    
-    for t in range(1, n + 1):
-        qx_wert = sterbetafel_obj.qx(alter + t - 1, sex)
-        barwert += tpx * qx_wert * (v ** t)
-        
-        if t < n:
-            tpx *= (1.0 - qx_wert)
+    # Alle qx-Werte auf einmal holen
+    qx_vec = sterbetafel_obj.qx_vec(alter, n, sex)
     
-    return barwert
+    return _nAe_x_kernel(qx_vec, v)
 
 def nE_x_val(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> float:
     """
@@ -217,10 +245,9 @@ def nE_x_val(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbet
     if n <= 0 or alter + n > MAX_ALTER:
         return 1.0
     
-    v = diskont(zins)
     n_px = npx_val(alter, n, sex, sterbetafel_obj)
     
-    return n_px * (v ** n)
+    return n_px * _v_pow_tabelle(zins)[n]
 
 def Ae_xn_val(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> float:
     """
@@ -273,45 +300,29 @@ def nAe_x_vec(alter: int, n: int, sex: str, zins: float,
     
     n = min(MAX_ALTER - alter, n)
     
-    # Ergebnis-Array (Laenge n+1, da auch t=n enthalten)
-    todesfallbarwerte = np.zeros(n + 1, dtype=float)
-    
-    # Diskontierungsfaktor
-    v = diskont(zins)
+    # Diskontierungsfaktoren v^0, v^1, ..., v^n
+    v_pow = _v_pow_tabelle(zins)[:n + 1]
     
     # Alle qx-Werte auf einmal holen
     qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
     px_all = 1.0 - qx_all
     
-    # Berechne fuer jedes t von 0 bis n
-    for t in range(n + 1):
-        restlaufzeit = n - t
-        
-        if restlaufzeit == 0:
-            # Keine Restlaufzeit -> Todesfallbarwert = 0
-            todesfallbarwerte[t] = 0.0
-        else:
-            alter_t = alter + t
-            
-            # px-Werte fuer Restlaufzeit
-            px_slice = px_all[t:n][:restlaufzeit]
-            
-            # tpx via kumulative Produkte
-            tpx_values = np.ones(restlaufzeit + 1)
-            tpx_values[1:] = np.cumprod(px_slice)
-            
-            # qx-Werte fuer Restlaufzeit
-            qx_slice = qx_all[t:n][:restlaufzeit]
-            
-            # Zeitpunkte s = 1, 2, ..., restlaufzeit
-            s = np.arange(1, restlaufzeit + 1)
-            v_s = v ** s
-            
-            # Todesfallbarwert:
-            # sum_{s=1}^{restlaufzeit} [(s-1)px * qx_{x+t+s-1} * v^s]
-            tpx_shifted = tpx_values[:restlaufzeit]  # (s-1)px fuer s=1..restlaufzeit
-            
-            todesfallbarwerte[t] = np.sum(tpx_shifted * qx_slice * v_s)
+    # (n-t)Ae_{x+t} = sum_{k>=t} [(kp_x / tp_x) * q_{x+k} * v^(k-t+1)], also mit
+    # a_k = kp_x * q_{x+k} * v^(k+1) eine Summe von hinten geteilt durch tp_x * v^t.
+    # Alter mit px = 0 (qx = 1) trennen die Laufzeit in Abschnitte: Ab Zeile t
+    # zaehlen nur Cashflows bis einschliesslich zum naechsten solchen Alter.
+    ausgestorben = px_all == 0.0
+    kpx = _kpx_abschnittsweise(px_all, ausgestorben)
+    
+    summen = np.zeros(n + 1, dtype=float)
+    summen[:n] = np.cumsum((kpx[:n] * qx_all * v_pow[1:])[::-1])[::-1]
+    
+    # Letzter Index je Abschnitt: naechstes t' >= t mit px = 0, sonst n-1
+    ende = _abschnitts_enden(ausgestorben)
+    
+    # Ergebnis-Array (Laenge n+1, da auch t=n enthalten; Index n bleibt 0)
+    todesfallbarwerte = np.zeros(n + 1, dtype=float)
+    todesfallbarwerte[:n] = (summen[:n] - summen[ende + 1]) / (kpx[:n] * v_pow[:n])
     
     return todesfallbarwerte
 
@@ -350,33 +361,26 @@ def nE_x_vec(alter: int, n: int, sex: str, zins: float,
     
     n = min(MAX_ALTER - alter, n)
     
-    # Diskontierungsfaktor
-    v = diskont(zins)
+    # Diskontierungsfaktoren v^n, v^(n-1), ..., v^0 (Restlaufzeit n-t)
+    v_pow_rest = _v_pow_tabelle(zins)[n::-1]
     
-    # Berechne einmal alle tpx-Werte
-    # tpx_matrix gibt uns tpx fuer t=0..n
-    tpx_values = tpx_matrix(alter, n, sex, sterbetafel_obj)
+    # npx_val liefert 1.0, sobald x+n MAX_ALTER erreicht -> (n-t)E_{x+t} = v^(n-t)
+    if alter + n >= MAX_ALTER:
+        return v_pow_rest.copy()
     
-    # Ergebnis-Array
-    erlebensfallbarwerte = np.zeros(n + 1, dtype=float)
+    # (n-t)E_{x+t} = (n-t)p_{x+t} * v^(n-t) mit (n-t)p_{x+t} = np_x / tp_x.
+    # Liegt zwischen x+t und x+n ein Alter mit px = 0, ist (n-t)p_{x+t} = 0;
+    # nur die Zeilen hinter dem letzten solchen Alter sind positiv.
+    px_all = sterbetafel_obj.px_vec(alter, n, sex)
+    ausgestorben = px_all == 0.0
+    kpx = _kpx_abschnittsweise(px_all, ausgestorben)
+    grenzen = np.flatnonzero(ausgestorben)
+    ab = grenzen[-1] + 1 if grenzen.size else 0
     
-    # Fuer jedes t von 0 bis n
-    for t in range(n + 1):
-        restlaufzeit = n - t
-        
-        if restlaufzeit == 0:
-            # Keine Restlaufzeit -> Erleben ist sicher
-            erlebensfallbarwerte[t] = 1.0
-        else:
-            # (n-t)E_{x+t} = (n-t)p_{x+t} * v^(n-t)
-            # 
-            # (n-t)p_{x+t} koennen wir aus tpx_values berechnen:
-            # (n-t)p_{x+t} = tp_x / tpx[t]  wo tp_x = npx von x aus
-            # 
-            # Aber einfacher: Berechne direkt via npx
-            n_t_px = npx_val(alter + t, restlaufzeit, sex, sterbetafel_obj)
-            
-            erlebensfallbarwerte[t] = n_t_px * (v ** restlaufzeit)
+    # Ergebnis-Array (bei t=n: Keine Restlaufzeit -> Erleben ist sicher)
+    erlebensfallbarwerte = np.zeros(n + 1, dtype=float)
+    erlebensfallbarwerte[ab:n] = (kpx[n] / kpx[ab:n]) * v_pow_rest[ab:n]
+    erlebensfallbarwerte[n] = 1.0
     
     return erlebensfallbarwerte
 
@@ -386,7 +390,62 @@ def nE_x_vec(alter: int, n: int, sex: str, zins: float,
 # Backup: Hilfsfunktionen fuer effiziente Verlaufswerte-Berechnung
 # =======================================================================================================================
 
-def verlaufswerte_setup(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> dict:
+# Geteilte Indextabelle 0..MAX_ALTER fuer t_array und alter_array (schreibgeschuetzt)
+_INDEX_TABELLE = np.arange(MAX_ALTER + 1)
+_INDEX_TABELLE.flags.writeable = False
+
+# Thread-lokale Arbeitspuffer je Datentyp fuer verlaufswerte_setup(arbeitspuffer=True)
+_ARBEITSBEREICH = threading.local()
+
+def _arbeitspuffer(dtype: np.dtype) -> np.ndarray:
+    """Liefert den Puffer (Laenge MAX_ALTER+1) des aktuellen Threads fuer den Datentyp."""
+    puffer = getattr(_ARBEITSBEREICH, 'puffer', None)
+    if puffer is None:
+        puffer = _ARBEITSBEREICH.puffer = {}
+    
+    schluessel = np.dtype(dtype).str
+    if schluessel not in puffer:
+        puffer[schluessel] = np.empty(MAX_ALTER + 1, dtype=dtype)
+    return puffer[schluessel]
+
+@dataclass(frozen=True, slots=True)
+class VerlaufSetup:
+    """
+    Vorberechnete Vektoren fuer die Verlaufswerte-Berechnung (Ergebnis von verlaufswerte_setup).
+    
+    Attributes:
+        tpx: tpx-Werte fuer t = 0..n
+        qx: qx-Werte fuer Alter x..x+n-1
+        px: px-Werte fuer Alter x..x+n-1
+        v_t: v^t fuer t = 0..n
+        vt_tpx: Diskontierte Ueberlebenswahrscheinlichkeiten v^t * tpx fuer t = 0..n
+        t_array: Array [0, 1, ..., n]
+        alter_array: Array [x, x+1, ..., x+n]
+        n: Versicherungsdauer (auf MAX_ALTER begrenzt)
+        alter: Eintrittsalter
+        sex: Geschlecht
+        zins: Zinssatz
+    """
+    tpx: np.ndarray
+    qx: np.ndarray
+    px: np.ndarray
+    v_t: np.ndarray
+    vt_tpx: np.ndarray
+    t_array: np.ndarray
+    alter_array: np.ndarray
+    n: int
+    alter: int
+    sex: str
+    zins: float
+    
+    def __getitem__(self, schluessel: str):
+        """Zugriff wie beim frueheren Dictionary, z.B. setup['tpx']."""
+        return getattr(self, schluessel)
+
+def verlaufswerte_setup(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+                        cache_dir: Optional[Union[str, Path, bool]] = None,
+                        dtype: np.dtype = np.float64,
+                        arbeitspuffer: bool = False) -> VerlaufSetup:
     """
     Bereitet alle benoetigten Vektoren fuer Verlaufswerte-Berechnung vor.
     
@@ -400,49 +459,126 @@ def verlaufswerte_setup(alter: int, n: int, sex: str, zins: float, sterbetafel_o
         sex: Geschlecht
         zins: Zinssatz
         sterbetafel_obj: Sterbetafel-Objekt
+        cache_dir: Optionales Verzeichnis fuer einen persistenten Cache ueber
+                   Programmlaeufe hinweg; True waehlt das Standardverzeichnis
+                   ~/.cache/xlsmToPython/verlauf. Ohne Angabe wird nichts auf
+                   die Festplatte geschrieben
+        dtype: Datentyp der Wahrscheinlichkeits- und Diskontvektoren
+               (z.B. np.float32 fuer Monte-Carlo-Laeufe; Standard np.float64)
+        arbeitspuffer: Wenn True, wird vt_tpx in einen thread-lokalen Puffer
+                       geschrieben statt neu angelegt. Das Ergebnis ist dann nur
+                       bis zum naechsten Aufruf im selben Thread gueltig.
     
     Returns:
-        Dictionary mit vorberechneten Vektoren:
-        - 'tpx': tpx-Werte fuer t = 0..n
-        - 'qx': qx-Werte fuer Alter x..x+n-1
-        - 'px': px-Werte fuer Alter x..x+n-1
-        - 'v_t': v^t fuer t = 0..n
-        - 't_array': Array [0, 1, ..., n]
-        - 'alter_array': Array [x, x+1, ..., x+n]
+        VerlaufSetup mit vorberechneten Vektoren (Attribute tpx, qx, px,
+        v_t, vt_tpx, t_array, alter_array sowie n, alter, sex, zins).
+        Bei dtype=np.float64 sind alle Vektoren ausser vt_tpx schreibgeschuetzte
+        Slices geteilter Tabellen (keine Allokation je Aufruf). Bei anderen
+        Datentypen werden tpx, qx, px und v_t je Aufruf einmal umgewandelt
+        (beschreibbare Kopien); t_array und alter_array bleiben Slices.
     
     Verwendung:
         >>> setup = verlaufswerte_setup(40, 20, 'M', 0.0175, st)
-        >>> tpx_values = setup['tpx']
-        >>> v_t_values = setup['v_t']
+        >>> tpx_values = setup.tpx
+        >>> v_t_values = setup.v_t
     """
     # Begrenze auf MAX_ALTER
     n = min(n, MAX_ALTER - alter)
     
-    # Zeit- und Alter-Arrays
-    t_array = np.arange(n + 1)
-    alter_array = alter + t_array
+    cache_datei = None
+    if cache_dir is not None and cache_dir is not False:
+        # Standardverzeichnis erst beim Aufruf bestimmen (Import haengt nicht von HOME ab)
+        verzeichnis = _standard_cache_dir() if cache_dir is True else Path(cache_dir)
+        cache_datei = _verlauf_cache_datei(verzeichnis, alter, n, sex, zins, sterbetafel_obj, dtype)
+        arrays = _lade_verlauf_cache(cache_datei)
+        if arrays is not None:
+            return VerlaufSetup(**arrays, n=n, alter=alter, sex=sex, zins=zins)
+    
+    # Zeit- und Alter-Arrays als Slices der geteilten Indextabelle
+    laenge = max(n + 1, 0)
+    t_array = _INDEX_TABELLE[:laenge]
+    alter_array = _INDEX_TABELLE[alter:alter + laenge]
     
     # Ueberlebenswahrscheinlichkeiten
-    tpx_values = tpx_matrix(alter, n, sex, sterbetafel_obj)
+    tpx_values = tpx_matrix(alter, n, sex, sterbetafel_obj, dtype=dtype)
     
     # Sterbe- und Ueberlebenswahrscheinlichkeiten
-    qx_values = sterbetafel_obj.qx_vec(alter, n, sex)
-    px_values = sterbetafel_obj.px_vec(alter, n, sex)
-    
-    # Diskontierungsfaktoren
-    v_t_values = diskont_vec(zins, t_array)
-    
-    return {
-        'tpx': tpx_values,
-        'qx': qx_values,
-        'px': px_values,
-        'v_t': v_t_values,
-        't_array': t_array,
-        'alter_array': alter_array,
-        'n': n,
-        'alter': alter,
-        'sex': sex,
-        'zins': zins
-    }
+    qx_values = sterbetafel_obj.qx_vec(alter, n, sex).astype(dtype, copy=False)
+    px_values = sterbetafel_obj.px_vec(alter, n, sex).astype(dtype, copy=False)
+    
+    # Diskontierungsfaktoren (Slice der gecachten v^t-Tabelle)
+    v_t_values = _v_pow_tabelle(zins)[:laenge].astype(dtype, copy=False)
+    
+    # Einmal fusioniert, da nahezu jeder Barwert sum(v^t * tpx * Cashflow) bildet
+    if arbeitspuffer:
+        vt_tpx_values = np.multiply(v_t_values, tpx_values, out=_arbeitspuffer(dtype)[:tpx_values.shape[0]])
+    else:
+        vt_tpx_values = v_t_values * tpx_values
+    
+    setup = VerlaufSetup(
+        tpx=tpx_values,
+        qx=qx_values,
+        px=px_values,
+        v_t=v_t_values,
+        vt_tpx=vt_tpx_values,
+        t_array=t_array,
+        alter_array=alter_array,
+        n=n,
+        alter=alter,
+        sex=sex,
+        zins=zins
+    )
+    
+    if cache_datei is not None:
+        _speichere_verlauf_cache(cache_datei, setup)
+    
+    return setup
+
+
+# =======================================================================================================================
+# Persistenter Cache fuer verlaufswerte_setup
+# =======================================================================================================================
+
+# Array-Felder von VerlaufSetup, die in der .npz-Datei abgelegt werden
+_VERLAUF_ARRAYS = ('tpx', 'qx', 'px', 'v_t', 'vt_tpx', 't_array', 'alter_array')
+
+def _standard_cache_dir() -> Path:
+    """Standardverzeichnis fuer den persistenten Cache (Verwendung: cache_dir=True)."""
+    return Path.home() / '.cache' / 'xlsmToPython' / 'verlauf'
+
+def _verlauf_cache_datei(cache_dir: Path, alter: int, n: int, sex: str, zins: float,
+                         sterbetafel_obj: Sterbetafel, dtype: np.dtype = np.float64) -> Path:
+    """Dateiname aus Tafel-Pruefsumme, Alter, Dauer, Geschlecht, gerundetem Zins und Datentyp."""
+    schluessel = (f"{sterbetafel_obj.pruefsumme}|{alter}|{n}|{sex.upper()}|{round(zins, 10)!r}"
+                  f"|{np.dtype(dtype).str}")
+    return cache_dir / f"{hashlib.sha1(schluessel.encode()).hexdigest()}.npz"
 
+def _lade_verlauf_cache(cache_datei: Path) -> Optional[dict]:
+    """Laedt die Arrays aus dem Cache (schreibgeschuetzt) oder None, falls nicht vorhanden/lesbar."""
+    if not cache_datei.exists():
+        return None
+    
+    try:
+        with np.load(cache_datei) as daten:
+            arrays = {name: daten[name] for name in _VERLAUF_ARRAYS}
+    except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    
+    for werte in arrays.values():
+        werte.flags.writeable = False
+    return arrays
 
+def _speichere_verlauf_cache(cache_datei: Path, setup: VerlaufSetup) -> None:
+    """Schreibt die Arrays atomar (temporaere Datei + os.replace) in den Cache."""
+    cache_datei.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Eindeutige temporaere Datei je Aufruf, auch bei mehreren Threads eines Prozesses
+    with tempfile.NamedTemporaryFile(dir=cache_datei.parent, prefix=f"{cache_datei.stem}.",
+                                     suffix='.tmp', delete=False) as datei:
+        try:
+            np.savez(datei, **{name: getattr(setup, name) for name in _VERLAUF_ARRAYS})
+        except BaseException:
+            datei.close()
+            os.unlink(datei.name)
+            raise
+    os.replace(datei.name, cache_datei)
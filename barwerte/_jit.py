@@ -0,0 +1,34 @@
+# =============================================================================
+# Optionale JIT-Kompilierung
+# =============================================================================
+"""
+Optionale JIT-Kompilierung der Rechenkerne mit Numba.
+
+Numba ist keine Pflicht-Abhaengigkeit. Ist es installiert, werden die mit
+@njit dekorierten Kerne beim ersten Aufruf zu Maschinencode kompiliert.
+Ohne Numba bleibt der Dekorator wirkungslos und die Funktionen laufen als
+normaler Python-Code.
+
+Verwendung:
+    from ._jit import njit, NUMBA_VERFUEGBAR
+
+    @njit(cache=True, fastmath=True)
+    def _kern(qx_vec, v):
+        ...
+"""
+
+try:
+    from numba import njit
+    NUMBA_VERFUEGBAR = True
+except ImportError:
+    NUMBA_VERFUEGBAR = False
+
+    def njit(*args, **kwargs):
+        """Ersatz fuer numba.njit ohne Wirkung (Numba nicht installiert)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
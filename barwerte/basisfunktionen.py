@@ -13,42 +13,95 @@ Performance-Gewinn:
 - Monte-Carlo-Simulationen: Deutliche Beschleunigung
 """
 
+import math
 import numpy as np
-import pandas as pd
-from pathlib import Path
-from typing import Union, Optional
+from functools import lru_cache
+from typing import Union
 
 from .sterbetafel import Sterbetafel, MAX_ALTER
+from ._jit import njit, NUMBA_VERFUEGBAR
 
 
 
-def diskont(zins: float) -> float:
+def diskont(zins: Union[float, np.ndarray, list]) -> Union[float, np.ndarray]:
     """
     Berechnet Diskontierungsfaktor v = 1/(1+i).
     
     Args:
-        zins: Jaehrlicher Zinssatz (z.B. 0.0175 fuer 1,75%)
+        zins: Jaehrlicher Zinssatz (z.B. 0.0175 fuer 1,75%) oder Array
+              von Zinssaetzen (z.B. Zinsszenarien)
     
     Returns:
-        Diskontierungsfaktor v
+        Diskontierungsfaktor v (v = 1 fuer zins <= 0), bei Array-Eingabe
+        ein Array gleicher Form
     """
-    if zins > 0:
-        return 1.0 / (1.0 + zins)
-    else:
-        return 1.0
+    if isinstance(zins, (int, float, np.number)):
+        return 1.0 / (1.0 + max(zins, 0.0))
+    
+    # Array-artige Eingabe ohne Kopie, falls bereits float64-Array;
+    # ohne Maske: np.maximum bildet zins <= 0 auf v = 1 ab
+    zins_array = np.asarray(zins, dtype=np.float64)
+    return np.reciprocal(1.0 + np.maximum(zins_array, 0.0))
 
-def diskont_vec(zins: float, t: int) -> np.ndarray:
+def _v_potenzen(v: float, anzahl: int) -> np.ndarray:
+    """v^t fuer t = 0..anzahl-1 als reine Multiplikationskette (cumprod statt np.power)."""
+    v_pow = np.empty(anzahl, dtype=float)
+    v_pow[:1] = 1.0
+    v_pow[1:] = v
+    np.cumprod(v_pow, out=v_pow)
+    return v_pow
+
+@lru_cache(maxsize=64)
+def _v_pow_tabelle(zins: float) -> np.ndarray:
+    """
+    Tabelle der Diskontierungsfaktoren v^t fuer t = 0..MAX_ALTER.
+    
+    Wird je Zinssatz einmal berechnet und danach aus dem Cache geliefert.
+    Das Array ist schreibgeschuetzt, da es von allen Aufrufern geteilt wird.
+    
+    Args:
+        zins: Jaehrlicher Zinssatz
+    
+    Returns:
+        NumPy-Array der Laenge MAX_ALTER+1 mit v^t-Werten
+    """
+    v_pow = _v_potenzen(diskont(zins), MAX_ALTER + 1)
+    v_pow.flags.writeable = False
+    return v_pow
+
+def diskont_vec(zins: float, t: Union[int, np.ndarray], dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet v^t fuer Array von t-Werten.
     
     Args:
         zins: Zinssatz (skalar)
-        n: Laufzeit
+        t: Laufzeit n (liefert v^0..v^(n-1)) oder Array ganzzahliger
+           bzw. beliebiger Exponenten t
+        dtype: Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         NumPy-Array mit v^t-Werten
     """
-    return diskont(zins) ** np.arange(t)
+    if not isinstance(t, (int, np.integer)):
+        t = np.asarray(t)
+        
+        # Ganzzahlige Exponenten im Tabellenbereich: Nachschlagen statt np.power
+        if t.dtype.kind in 'iu' and (t.size == 0 or (t.min() >= 0 and t.max() <= MAX_ALTER)):
+            return _v_pow_tabelle(zins)[t].astype(dtype, copy=False)
+        
+        return (diskont(zins) ** t).astype(dtype, copy=False)
+    
+    # Wie np.arange(t): keine Werte fuer t <= 0 (sonst Slice vom Tabellenende)
+    if t <= 0:
+        return np.empty(0, dtype=dtype)
+    
+    if t <= MAX_ALTER + 1:
+        return _v_pow_tabelle(zins)[:t].astype(dtype)
+    
+    return _v_potenzen(diskont(zins), t).astype(dtype, copy=False)
+
+# Woolhouse-Stuetzstellen w/k je unterjahriger Zahlungsweise, einmalig beim Import
+_W_STUETZSTELLEN = {k: np.arange(k) / k for k in (2, 4, 12)}
 
 def abzugsglied(k: int, zins: float) -> float:
     """
@@ -68,55 +121,98 @@ def abzugsglied(k: int, zins: float) -> float:
     
     Returns:
         Abzugsglied
+    
+    Hinweis:
+        Das Ergebnis wird je (k, zins) gecacht, da innerhalb eines
+        Bewertungslaufs stets dieselbe Kombination verwendet wird. Der Zins
+        wird fuer den Cache-Schluessel auf 10 Nachkommastellen gerundet, damit
+        leicht gestoerte Gleitkommawerte denselben Eintrag treffen.
     """
+    return _abzugsglied_gecacht(k, round(zins, 10))
 
-    if k <= 0 or k == 1:
+@lru_cache(maxsize=128)
+def _abzugsglied_gecacht(k: int, zins: float) -> float:
+    """Gecachte Berechnung zu abzugsglied() (zins bereits gerundet)."""
+    # Stuetzstellen w/k fuer w = 0..k-1 (nur fuer k = 2, 4, 12 vorhanden;
+    # k = 1 und alle anderen Zahlungsweisen ergeben 0)
+    w = _W_STUETZSTELLEN.get(k)
+    if w is None:
         return 0.0
     
-    if k not in [1, 2, 4, 12]:
-        return 0.0
+    abzug = (1.0 + zins) / k * np.sum(w / (1.0 + w * zins))
     
-    abzug = 0.0
-    for w in range(k):
-        abzug += (w / k) / (1.0 + (w / k) * zins)
+    return float(abzug)
+
+@njit(cache=True)
+def _tpx_aus_qx_nb(qx_werte: np.ndarray) -> np.ndarray:
+    """tpx fuer t = 0..n aus qx-Werten als skalare Schleife (inlinebar in Numba-Kernen)."""
+    tpx = np.empty(qx_werte.shape[0] + 1)
+    tpx[0] = 1.0
+    produkt = 1.0
+    for i in range(qx_werte.shape[0]):
+        produkt *= (1.0 - qx_werte[i])
+        tpx[i + 1] = produkt
+    return tpx
+
+def _tpx_aus_qx_np(qx_werte: np.ndarray) -> np.ndarray:
+    """NumPy-Variante von _tpx_aus_qx_nb (ohne Numba)."""
+    tpx = np.empty(qx_werte.shape[0] + 1, dtype=float)
+    tpx[0] = 1.0
+    np.cumprod(1.0 - qx_werte, out=tpx[1:])
+    return tpx
+
+# Ohne Numba waere die Schleife in reinem Python langsamer als np.cumprod
+_tpx_aus_qx = _tpx_aus_qx_nb if NUMBA_VERFUEGBAR else _tpx_aus_qx_np
+
+def _kpx_abschnittsweise(px_all: np.ndarray, ausgestorben: np.ndarray) -> np.ndarray:
+    """
+    Kumulative Produkte kp_x fuer k = 0..n, wobei px = 0 als 1 gezaehlt wird.
     
-    abzug *= (1.0 + zins) / k
+    Quotienten kp_x / tp_x bleiben so auch hinter einem Alter mit qx = 1
+    endlich und entsprechen innerhalb eines Abschnitts ohne solches Alter
+    der bedingten Ueberlebenswahrscheinlichkeit (k-t)p_{x+t}.
+    """
+    kpx = np.empty(px_all.shape[0] + 1, dtype=px_all.dtype)
+    kpx[0] = 1.0
+    np.cumprod(np.where(ausgestorben, px_all.dtype.type(1.0), px_all), out=kpx[1:])
+    return kpx
+
+def _abschnitts_enden(ausgestorben: np.ndarray) -> np.ndarray:
+    """
+    Letzter Index des Abschnitts je t = 0..n-1: naechstes t' >= t mit px = 0, sonst n-1.
     
-    return abzug
+    Ab Zeile t zaehlen nur Cashflows bis einschliesslich zu diesem Index.
+    """
+    n = ausgestorben.shape[0]
+    grenzen = np.flatnonzero(ausgestorben)
+    pos = np.searchsorted(grenzen, np.arange(n))
+    return np.append(grenzen, n - 1)[pos]
 
-def npx(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def npx_array(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarray:
     """
-    Berechnet n-jahrige Ueberlebenswahrscheinlichkeit: npx
+    Berechnet alle j-jahrigen Ueberlebenswahrscheinlichkeiten jpx fuer j = 0..n.
     
-    Formel: npx = px * px+1 * ... * px+n-1 = npx = (1-qx) * (1-qx+1) * ... * (1-qx+n-1)
+    Formel: jpx = px * px+1 * ... * px+j-1 = (1-qx) * (1-qx+1) * ... * (1-qx+j-1)
+    
+    Array-Variante zu npx_val(); die Werte entsprechen tpx_matrix(alter, n, ...).
+    
+    Args:
+        alter: Startalter
+        n: Anzahl Jahre
+        sex: Geschlecht ('M' oder 'F')
+        sterbetafel_obj: Sterbetafel-Objekt
+    
+    Returns:
+        NumPy-Array der Laenge n+1 (leer, falls n <= 0 oder alter+n > MAX_ALTER)
     """
     if n <= 0 or alter + n > MAX_ALTER:
         return np.array([])
     
-    n = min(MAX_ALTER - alter, n)
-    
-    # Alle qx-Werte auf einmal holen
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
-    px_all = 1.0 - qx_all
-
-    # Ergebnis-Array
-    n_j_px = np.zeros(n+1, dtype=float)
-    
-    # Berechne fuer jedes m
-    for j in range(n+1):
-        # px-Werte 
-        px_slice = np.append([1.0], px_all[0:j][:j])
+    return tpx_matrix(alter, n, sex, sterbetafel_obj)
 
-        # tpx via kumulative Produkte
-        jpx_values = np.ones(j+2)
-        jpx_values[1:] = np.cumprod(px_slice)
-        n_j_px[j] = jpx_values[j+1]
-
-    return n_j_px
-
-def nqx(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def nqx_array(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarray:
     """
-    Berechnet n-jahrige Sterbewahrscheinlichkeit: nqx
+    Berechnet n-jahrige Sterbewahrscheinlichkeiten als Array (Array-Variante zu nqx_val()).
     
     Formel: nqx = (n-1)px * qx+n-1
     """
@@ -125,24 +221,20 @@ def nqx(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarra
     
     n = min(MAX_ALTER - alter, n)
     
-    # Alle qx-Werte auf einmal holen
+    # Alle qx-Werte auf einmal holen (Alter x-1 bis x+n-1); jpx ab Alter x
+    # fuer j = 0..n-1 ergibt sich aus demselben Block, ohne zweiten Tafelzugriff
     qx_all = sterbetafel_obj.qx_vec(alter-1, n+1, sex)
-    npx_all = npx(alter, n, sex, sterbetafel_obj)
+    npx_all = _tpx_aus_qx(qx_all[1:n])
 
-    # Ergebnis-Array
-    n_j_qx = np.zeros(n+1, dtype=float)
-    
-    # Berechne fuer jedes m
-    for j in range(n+1):
-        # qx-Werte 
-        if j == 0:
-             n_j_qx[j] = qx_all[j]
-        else:
-            n_j_qx[j] = qx_all[j] * npx_all[j-1]
+    # Ergebnis-Array: n_j_qx[j] = qx_all[j] * npx_all[j-1], n_j_qx[0] = qx_all[0]
+    n_j_qx = np.empty(n+1, dtype=float)
+    n_j_qx[0] = qx_all[0]
+    n_j_qx[1:] = qx_all[1:n+1] * npx_all
 
     return n_j_qx
 
-def tpx_matrix(alter: int, max_t: int, sex: str, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def tpx_matrix(alter: int, max_t: int, sex: str, sterbetafel_obj: Sterbetafel,
+               dtype: np.dtype = np.float64) -> np.ndarray:
     """
     VEKTORISIERT: Berechnet Matrix aller tpx-Werte fuer t = 0, 1, ..., max_t.
     
@@ -159,10 +251,13 @@ def tpx_matrix(alter: int, max_t: int, sex: str, sterbetafel_obj: Sterbetafel) -
         max_t: Maximale Laufzeit
         sex: Geschlecht ('M' oder 'F')
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe,
+               halbiert den Speicherbedarf; Standard np.float64)
     
     Returns:
         NumPy-Array der Laenge (max_t + 1) mit tpx-Werten
         Index t enthaelt tpx (Ueberlebenswahrscheinlichkeit bis Zeit t)
+        (schreibgeschuetzter Slice aus dem tpx-Cache der Sterbetafel)
     
     Beispiel:
         >>> # Berechne alle tpx fuer Alter 40, t = 0..20
@@ -171,39 +266,83 @@ def tpx_matrix(alter: int, max_t: int, sex: str, sterbetafel_obj: Sterbetafel) -
         >>> print(tpx_values[10])  # 10px
     
     Performance:
-        - Einzelner Aufruf: Minimal langsamer als npx()
-        - Mehrere t-Werte: 100x+ schneller als mehrere npx()-Aufrufe
+        - Einzelner Aufruf: Minimal langsamer als npx_val()
+        - Mehrere t-Werte: 100x+ schneller als mehrere npx_val()-Aufrufe
     
     Technische Details:
-        Nutzt np.cumprod() fuer kumulative Produkte - sehr effizient!
+        Division der vorberechneten Ueberlebensordnung: tpx = l_{x+t} / l_x
+        (siehe Sterbetafel.tpx_vec), kein kumulatives Produkt je Aufruf.
     """
     if max_t <= 0 or alter >= MAX_ALTER:
-        return np.array([1.0])
+        return np.array([1.0], dtype=dtype)
     
     # Begrenze auf verfuegbare Alter
     max_t = min(max_t, MAX_ALTER - alter)
     
-    # Hole alle px-Werte auf einmal
-    px_werte = sterbetafel_obj.px_vec(alter, max_t, sex)
+    # tpx = l_{x+t} / l_x aus der vorberechneten Ueberlebensordnung der Tafel
+    tpx_values = sterbetafel_obj.tpx_vec(alter, max_t, sex)
     
-    # Berechne kumulative Produkte
-    # tpx[0] = 1 (0px = 1)
-    # tpx[1] = px[0]
-    # tpx[2] = px[0] * px[1]
-    # ...
-    # tpx[t] = px[0] * px[1] * ... * px[t-1]
-    tpx_values = np.ones(max_t + 1, dtype=float)
-    tpx_values[1:] = np.cumprod(px_werte)
-    
-    return tpx_values
+    # Fuer float64 ohne Kopie (Slice aus dem Cache)
+    return tpx_values.astype(dtype, copy=False)
+
 
+def tpx_matrix_batch(alter_array: np.ndarray, max_t: int, sex: str, sterbetafel_obj: Sterbetafel,
+                     dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    VEKTORISIERT: Berechnet tpx fuer t = 0..max_t fuer einen ganzen Bestand von Startaltern.
+    
+    Zeile i entspricht tpx_matrix(alter_array[i], max_t, ...). Statt eines
+    Aufrufs je Alter wird ein px-Block geholt und ein einziges cumprod
+    entlang der Laufzeit gebildet.
+    
+    Args:
+        alter_array: Array der Startalter
+        max_t: Maximale Laufzeit (fuer alle Alter gleich)
+        sex: Geschlecht ('M' oder 'F')
+        sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Ergebnis-Datentyp (Standard np.float64)
+    
+    Returns:
+        NumPy-Array der Form (len(alter_array), max_t + 1) mit tpx-Werten
+    
+    Raises:
+        ValueError: Wenn fuer ein Alter alter + max_t > MAX_ALTER
+    
+    Beispiel:
+        >>> tpx_block = tpx_matrix_batch(np.array([30, 40, 50]), 20, 'M', st)
+        >>> tpx_block[1]   # entspricht tpx_matrix(40, 20, 'M', st)
+    """
+    alter_array = np.asarray(alter_array, dtype=np.int64)
+    anzahl = alter_array.shape[0]
+    
+    if max_t <= 0:
+        return np.ones((anzahl, 1), dtype=dtype)
+    
+    if anzahl == 0:
+        return np.ones((0, max_t + 1), dtype=dtype)
+    
+    if int(alter_array.max()) + max_t > MAX_ALTER:
+        raise ValueError(
+            f"Laufzeit {max_t} ueberschreitet MAX_ALTER={MAX_ALTER} "
+            f"fuer Startalter {int(alter_array.max())}"
+        )
+    
+    px_block = sterbetafel_obj.px_block(alter_array, max_t, sex)
+    
+    tpx_block = np.empty((anzahl, max_t + 1), dtype=dtype)
+    tpx_block[:, 0] = 1.0
+    np.cumprod(px_block, axis=1, out=tpx_block[:, 1:])
+    
+    return tpx_block
 
 
 # =======================================================================================================================
-# Backup Funktionen
+# Skalare Funktionen
 # =======================================================================================================================
 
-# Skalare Funktionen
+# Bis zu dieser Laufzeit wird npx_val ohne NumPy-Reduktion berechnet
+_NPX_SKALAR_GRENZE = 16
+
 def npx_val(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> float:
     """
     Berechnet n-jahrige Ueberlebenswahrscheinlichkeit: npx    
@@ -222,7 +361,13 @@ def npx_val(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> float
         return 1.0
     
     px_werte = sterbetafel_obj.px_vec(alter, n, sex)
-    return np.prod(px_werte)
+    
+    # Kurze Laufzeiten: math.prod ueber Python-Floats ist schneller als jeder NumPy-Aufruf
+    if n < _NPX_SKALAR_GRENZE:
+        return math.prod(px_werte.tolist())
+    
+    # Direkte Reduktion ohne den Dispatch-Overhead von np.prod
+    return float(np.multiply.reduce(px_werte))
 
 def nqx_val(alter: int, n: int, sex: str, sterbetafel_obj: Sterbetafel) -> float:
     """
@@ -2,12 +2,13 @@
 # Rein finanzmathematische Funktionen (ohne Sterblichkeit)
 # =============================================================================
 
+import math
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Union, Optional
 
-from .basisfunktionen import diskont, abzugsglied
+from .basisfunktionen import abzugsglied
 
 def ag_k(g: int, zins: float, k: int) -> float:
     """
@@ -27,12 +28,58 @@ def ag_k(g: int, zins: float, k: int) -> float:
     if k <= 0 or g <= 0:
         return 0.0
     
-    if zins == 0:
+    # v = 1 (diskont kappt negative Zinsen): Grenzwert der Formel ist g
+    if zins <= 0:
         return float(g)
     
-    v = diskont(zins)
     abzug = abzugsglied(k, zins)
     
-    barwert = (1.0 - v ** g) / (1.0 - v) - abzug * (1.0 - v ** g)
+    # 1 - v^g = -expm1(g * log(v)) und 1 - v = i * v, stabil auch fuer i -> 0
+    eins_minus_vg = -math.expm1(-g * math.log1p(zins))
+    
+    barwert = eins_minus_vg * (1.0 + zins) / zins - abzug * eins_minus_vg
     
     return barwert
+
+def ag_k_vec(g_array: np.ndarray, zins: Union[float, np.ndarray], k: int) -> np.ndarray:
+    """
+    VEKTORISIERT: Berechnet ag^(k) fuer ein Array von Laufzeiten (und optional Zinssaetzen).
+    
+    Elementweise identisch zu ag_k(), aber ohne Python-Schleife ueber g.
+    Bei einem Zins-Array wird das Ergebnis als Gitter (Zins x Laufzeit)
+    gebildet, z.B. fuer Sensitivitaeten.
+    
+    Args:
+        g_array: Array der Anzahl Jahre
+        zins: Jaehrlicher Zinssatz (skalar) oder Array von Zinssaetzen
+        k: Zahlungsweise (1, 2, 4, oder 12)
+    
+    Returns:
+        NumPy-Array der Form g_array.shape (skalarer Zins) bzw.
+        zins.shape + g_array.shape (Zins-Array)
+    
+    Beispiel:
+        >>> ag_k_vec(np.arange(1, 41), 0.0175, 12)                  # Form (40,)
+        >>> ag_k_vec(np.arange(1, 41), np.array([0.01, 0.02]), 12)  # Form (2, 40)
+    """
+    g = np.asarray(g_array, dtype=float)
+    zins_array = np.asarray(zins, dtype=float)
+    
+    # Zins-Achsen vor die Laufzeit-Achsen stellen (Gitter Zins x Laufzeit)
+    i = zins_array.reshape(zins_array.shape + (1,) * g.ndim)
+    ergebnis_form = zins_array.shape + g.shape
+    
+    if k <= 0:
+        return np.zeros(ergebnis_form)
+    
+    # Abzugsglied je Zinssatz (gecacht, daher nur einmal je Zins berechnet)
+    abzug = np.array([abzugsglied(k, float(z)) for z in zins_array.ravel()]).reshape(i.shape)
+    
+    # Wie ag_k: 1 - v^g = -expm1(g * log(v)), 1 - v = i * v; fuer i <= 0 gilt v = 1
+    i_pos = np.maximum(i, 0.0)
+    eins_minus_vg = -np.expm1(-g * np.log1p(i_pos))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        barwert = eins_minus_vg * (1.0 + i_pos) / i_pos - abzug * eins_minus_vg
+    
+    barwert = np.where(i_pos > 0.0, barwert, g)
+    return np.where(g > 0, barwert, 0.0)
@@ -16,8 +16,11 @@ Migriert von VBA (mKommutationswerte.txt)
 """
 
 import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Literal
 from barwerte import Sterbetafel
+from barwerte.basisfunktionen import diskont, abzugsglied, _v_pow_tabelle
 
 # Konstanten fuer Rundung
 RUND_LX = 16
@@ -30,6 +33,42 @@ RUND_RX = 16
 MAX_ALTER = 121  # Abweichend von barwerte.py (dort 123)
 
 
+def _rueckwaerts_summe(werte: np.ndarray) -> np.ndarray:
+    """
+    Summe aller Werte ab Index x: S[x] = sum(werte[i] for i >= x).
+    
+    Entspricht der Rekursion S[x] = werte[x] + S[x+1] als ein kumulatives
+    Summieren ueber das umgedrehte Array.
+    """
+    return np.ascontiguousarray(np.cumsum(werte[::-1])[::-1])
+
+
+@dataclass(frozen=True, slots=True)
+class KommutationsTabelle:
+    """
+    Kommutationswerte eines Geschlechts als schreibgeschuetzte Vektoren
+    (Datentyp wie Kommutationswerte.dtype, Standard float64).
+    
+    Attributes
+    ----------
+    lx, Dx, Nx, Mx, Rx : np.ndarray
+        Werte fuer Alter 0 bis MAX_ALTER
+    tx, Cx : np.ndarray
+        Werte fuer Alter 0 bis MAX_ALTER-1
+    """
+    lx: np.ndarray
+    tx: np.ndarray
+    Dx: np.ndarray
+    Cx: np.ndarray
+    Nx: np.ndarray
+    Mx: np.ndarray
+    Rx: np.ndarray
+    
+    def __getitem__(self, schluessel: str) -> np.ndarray:
+        """Zugriff wie beim frueheren Dictionary, z.B. tabelle['Dx']."""
+        return getattr(self, schluessel)
+
+
 class Kommutationswerte:
     """
     Klasse zur Berechnung von Kommutationswerten und darauf basierenden Barwerten.
@@ -51,7 +90,7 @@ class Kommutationswerte:
     Barwertberechnungen sehr schnell durchgefuehrt werden koennen.
     """
     
-    def __init__(self, sterbetafel: Sterbetafel, zins: float):
+    def __init__(self, sterbetafel: Sterbetafel, zins: float, dtype: np.dtype = np.float64):
         """
         Initialisiert Kommutationswerte-Objekt.
         
@@ -61,14 +100,38 @@ class Kommutationswerte:
             Sterbetafel-Objekt mit qx-Werten
         zins : float
             Rechnungszins (z.B. 0.0175 fuer 1,75%)
+        dtype : np.dtype, optional
+            Datentyp der gecachten Vektoren (Standard: float64). Mit np.float32
+            halbiert sich der Speicherbedarf, die Barwerte sind dann aber nur
+            noch auf ca. 7 Stellen genau (relativer Fehler ~1e-7).
+            Die Vektoren werden in float64 aufgebaut und gerundet und erst
+            danach umgewandelt. Die Barwerte (ax_k, axn_k, nAx, ...) werden aus
+            den umgewandelten Vektoren gebildet und haben daher diesen Datentyp;
+            die *_batch-Methoden liefern float64.
         """
         self.sterbetafel = sterbetafel
         self.zins = zins
-        self.v = 1.0 / (1.0 + zins) if zins > 0 else 1.0
+        self.dtype = np.dtype(dtype)
+        self.v = diskont(zins)
+        
+        # Diskontierungsfaktoren v^x fuer x = 0..MAX_ALTER (geteilte, schreibgeschuetzte Tabelle)
+        self._v_pow = _v_pow_tabelle(zins)
+        
+        # Abzugsglieder der ueblichen Zahlungsweisen, der Zins ist je Objekt fest
+        self._beta = {zw: abzugsglied(zw, zins) for zw in (1, 2, 4, 12)}
+        
+        # 1 / (1 - v) fuer ag_k; bei v = 1 (Zins <= 0) wird ag_k direkt zu g
+        self._inv_eins_minus_v = 1.0 / (1.0 - self.v) if self.v != 1.0 else float('inf')
         
         # Cache fuer berechnete Vektoren (nach Geschlecht)
         self._cache = {}
     
+    def _vpow(self, n: int) -> float:
+        """v^n aus der vorberechneten Tabelle, ausserhalb 0..MAX_ALTER per Potenz."""
+        if 0 <= n <= MAX_ALTER:
+            return float(self._v_pow[n])
+        return self.v ** n
+    
     def _get_cache_key(self, geschlecht: str) -> str:
         """Erzeugt Cache-Schluessel."""
         return f"{geschlecht}_{self.zins}"
@@ -96,18 +159,7 @@ class Kommutationswerte:
             Array mit lx-Werten von Alter 0 bis endalter
         """
         grenze = MAX_ALTER if endalter is None else endalter
-        
-        # Initialisierung: Radix = 1.000.000
-        lx = np.zeros(grenze + 1)
-        lx[0] = 1_000_000.0
-        
-        # Iterative Berechnung: lx+1 = lx * (1 - qx)
-        for i in range(1, grenze + 1):
-            qx_wert = self.sterbetafel.qx(i - 1, geschlecht)
-            lx[i] = lx[i - 1] * (1.0 - qx_wert)
-            lx[i] = np.round(lx[i], RUND_LX)
-        
-        return lx
+        return self._get_kommutationswerte(geschlecht).lx[:grenze + 1]
     
     def _berechne_tx_vektor(self, geschlecht: str, endalter: Optional[int] = None) -> np.ndarray:
         """
@@ -130,17 +182,7 @@ class Kommutationswerte:
             Array mit tx-Werten von Alter 0 bis endalter-1
         """
         grenze = MAX_ALTER if endalter is None else endalter
-        
-        # Hole lx-Vektor
-        lx = self._berechne_lx_vektor(geschlecht, grenze)
-        
-        # Berechne tx = lx - lx+1
-        tx = np.zeros(grenze)
-        for i in range(grenze):
-            tx[i] = lx[i] - lx[i + 1]
-            tx[i] = np.round(tx[i], RUND_TX)
-        
-        return tx
+        return self._get_kommutationswerte(geschlecht).tx[:grenze]
     
     def _berechne_Dx_vektor(self, geschlecht: str, endalter: Optional[int] = None) -> np.ndarray:
         """
@@ -164,17 +206,7 @@ class Kommutationswerte:
             Array mit Dx-Werten von Alter 0 bis endalter
         """
         grenze = MAX_ALTER if endalter is None else endalter
-        
-        # Hole lx-Vektor
-        lx = self._berechne_lx_vektor(geschlecht, grenze)
-        
-        # Berechne Dx = lx * v^x
-        Dx = np.zeros(grenze + 1)
-        for i in range(grenze + 1):
-            Dx[i] = lx[i] * (self.v ** i)
-            Dx[i] = np.round(Dx[i], RUND_DX)
-        
-        return Dx
+        return self._get_kommutationswerte(geschlecht).Dx[:grenze + 1]
     
     def _berechne_Cx_vektor(self, geschlecht: str, endalter: Optional[int] = None) -> np.ndarray:
         """
@@ -198,17 +230,7 @@ class Kommutationswerte:
             Array mit Cx-Werten von Alter 0 bis endalter-1
         """
         grenze = MAX_ALTER if endalter is None else endalter
-        
-        # Hole tx-Vektor
-        tx = self._berechne_tx_vektor(geschlecht, grenze)
-        
-        # Berechne Cx = tx * v^(x+1)
-        Cx = np.zeros(grenze)
-        for i in range(grenze):
-            Cx[i] = tx[i] * (self.v ** (i + 1))
-            Cx[i] = np.round(Cx[i], RUND_CX)
-        
-        return Cx
+        return self._get_kommutationswerte(geschlecht).Cx[:grenze]
     
     def _berechne_Nx_vektor(self, geschlecht: str) -> np.ndarray:
         """
@@ -230,18 +252,7 @@ class Kommutationswerte:
         np.ndarray
             Array mit Nx-Werten von Alter 0 bis MAX_ALTER
         """
-        # Hole Dx-Vektor
-        Dx = self._berechne_Dx_vektor(geschlecht, None)
-        
-        # Berechne Nx rekursiv von hinten
-        Nx = np.zeros(MAX_ALTER + 1)
-        Nx[MAX_ALTER] = Dx[MAX_ALTER]
-        
-        for i in range(MAX_ALTER - 1, -1, -1):
-            Nx[i] = Nx[i + 1] + Dx[i]
-            Nx[i] = np.round(Nx[i], RUND_NX)
-        
-        return Nx
+        return self._get_kommutationswerte(geschlecht).Nx
     
     def _berechne_Mx_vektor(self, geschlecht: str) -> np.ndarray:
         """
@@ -263,18 +274,7 @@ class Kommutationswerte:
         np.ndarray
             Array mit Mx-Werten von Alter 0 bis MAX_ALTER
         """
-        # Hole Cx-Vektor
-        Cx = self._berechne_Cx_vektor(geschlecht, None)
-        
-        # Berechne Mx rekursiv von hinten
-        Mx = np.zeros(MAX_ALTER + 1)
-        Mx[MAX_ALTER] = Cx[MAX_ALTER - 1] if MAX_ALTER > 0 else 0.0
-        
-        for i in range(MAX_ALTER - 1, -1, -1):
-            Mx[i] = Mx[i + 1] + Cx[i]
-            Mx[i] = np.round(Mx[i], RUND_MX)
-        
-        return Mx
+        return self._get_kommutationswerte(geschlecht).Mx
     
     def _berechne_Rx_vektor(self, geschlecht: str) -> np.ndarray:
         """
@@ -296,20 +296,58 @@ class Kommutationswerte:
         np.ndarray
             Array mit Rx-Werten von Alter 0 bis MAX_ALTER
         """
-        # Hole Mx-Vektor
-        Mx = self._berechne_Mx_vektor(geschlecht)
-        
-        # Berechne Rx rekursiv von hinten
-        Rx = np.zeros(MAX_ALTER + 1)
-        Rx[MAX_ALTER] = Mx[MAX_ALTER]
+        return self._get_kommutationswerte(geschlecht).Rx
+    
+    def _berechne_alle(self, geschlecht: str) -> KommutationsTabelle:
+        """
+        Berechnet alle Kommutationswerte in einem Durchlauf.
         
-        for i in range(MAX_ALTER - 1, -1, -1):
-            Rx[i] = Rx[i + 1] + Mx[i]
-            Rx[i] = np.round(Rx[i], RUND_RX)
+        Die Kette qx -> lx -> tx/Dx -> Cx -> Nx/Mx -> Rx wird genau einmal
+        durchlaufen, jeder Zwischenwert wird direkt weiterverwendet.
         
-        return Rx
+        Parameters
+        ----------
+        geschlecht : str
+            'M' oder 'F'
+            
+        Returns
+        -------
+        KommutationsTabelle
+            Schreibgeschuetzte Vektoren lx, tx, Dx, Cx, Nx, Mx, Rx
+        """
+        # lx+1 = lx * (1 - qx) als kumulatives Produkt, Radix = 1.000.000
+        lx = np.empty(MAX_ALTER + 1)
+        lx[0] = 1_000_000.0
+        np.cumprod(self.sterbetafel.px_vector(geschlecht)[:MAX_ALTER], out=lx[1:])
+        lx[1:] *= 1_000_000.0
+        np.round(lx, RUND_LX, out=lx)
+        
+        # tx = lx - lx+1
+        tx = lx[:-1] - lx[1:]
+        np.round(tx, RUND_TX, out=tx)
+        
+        # Dx = lx * v^x, Cx = tx * v^(x+1)
+        Dx = lx * self._v_pow[:MAX_ALTER + 1]
+        np.round(Dx, RUND_DX, out=Dx)
+        Cx = tx * self._v_pow[1:MAX_ALTER + 1]
+        np.round(Cx, RUND_CX, out=Cx)
+        
+        # Summen von hinten; Startwert Mx[MAX_ALTER] = Cx[MAX_ALTER-1]
+        Nx = _rueckwaerts_summe(Dx)
+        np.round(Nx, RUND_NX, out=Nx)
+        Mx = _rueckwaerts_summe(np.append(Cx, Cx[MAX_ALTER - 1]))
+        np.round(Mx, RUND_MX, out=Mx)
+        Rx = _rueckwaerts_summe(Mx)
+        np.round(Rx, RUND_RX, out=Rx)
+        
+        # Erst nach der Rechnung in float64 auf den gewuenschten Datentyp bringen
+        lx, tx, Dx, Cx, Nx, Mx, Rx = (vektor.astype(self.dtype, copy=False)
+                                      for vektor in (lx, tx, Dx, Cx, Nx, Mx, Rx))
+        for vektor in (lx, tx, Dx, Cx, Nx, Mx, Rx):
+            vektor.flags.writeable = False
+        return KommutationsTabelle(lx=lx, tx=tx, Dx=Dx, Cx=Cx, Nx=Nx, Mx=Mx, Rx=Rx)
     
-    def _get_kommutationswerte(self, geschlecht: str) -> dict:
+    def _get_kommutationswerte(self, geschlecht: str) -> KommutationsTabelle:
         """
         Holt alle Kommutationswerte aus dem Cache oder berechnet sie.
         
@@ -320,21 +358,14 @@ class Kommutationswerte:
             
         Returns
         -------
-        dict
-            Dictionary mit allen Kommutationswerten (lx, Dx, Nx, Cx, Mx, Rx)
+        KommutationsTabelle
+            Alle Kommutationswerte (lx, tx, Dx, Cx, Nx, Mx, Rx)
         """
         cache_key = self._get_cache_key(geschlecht)
         
         if cache_key not in self._cache:
-            # Berechne alle Werte
-            self._cache[cache_key] = {
-                'lx': self._berechne_lx_vektor(geschlecht),
-                'Dx': self._berechne_Dx_vektor(geschlecht),
-                'Nx': self._berechne_Nx_vektor(geschlecht),
-                'Cx': self._berechne_Cx_vektor(geschlecht),
-                'Mx': self._berechne_Mx_vektor(geschlecht),
-                'Rx': self._berechne_Rx_vektor(geschlecht)
-            }
+            # Berechne alle Werte in einem Durchlauf
+            self._cache[cache_key] = self._berechne_alle(geschlecht)
         
         return self._cache[cache_key]
     
@@ -359,8 +390,7 @@ class Kommutationswerte:
         if alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['lx'][alter]
+        return self._get_kommutationswerte(geschlecht).lx[alter]
     
     def tx(self, alter: int, geschlecht: str) -> float:
         """
@@ -381,8 +411,7 @@ class Kommutationswerte:
         if alter < 0 or alter >= MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['lx'][alter] - werte['lx'][alter + 1]
+        return self._get_kommutationswerte(geschlecht).tx[alter]
     
     def Dx(self, alter: int, geschlecht: str) -> float:
         """
@@ -403,8 +432,7 @@ class Kommutationswerte:
         if alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['Dx'][alter]
+        return self._get_kommutationswerte(geschlecht).Dx[alter]
     
     def Cx(self, alter: int, geschlecht: str) -> float:
         """
@@ -425,8 +453,7 @@ class Kommutationswerte:
         if alter < 0 or alter >= MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['Cx'][alter]
+        return self._get_kommutationswerte(geschlecht).Cx[alter]
     
     def Nx(self, alter: int, geschlecht: str) -> float:
         """
@@ -447,8 +474,7 @@ class Kommutationswerte:
         if alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['Nx'][alter]
+        return self._get_kommutationswerte(geschlecht).Nx[alter]
     
     def Mx(self, alter: int, geschlecht: str) -> float:
         """
@@ -469,8 +495,7 @@ class Kommutationswerte:
         if alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['Mx'][alter]
+        return self._get_kommutationswerte(geschlecht).Mx[alter]
     
     def Rx(self, alter: int, geschlecht: str) -> float:
         """
@@ -491,8 +516,7 @@ class Kommutationswerte:
         if alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        werte = self._get_kommutationswerte(geschlecht)
-        return werte['Rx'][alter]
+        return self._get_kommutationswerte(geschlecht).Rx[alter]
     
     # Barwertberechnungen basierend auf Kommutationswerten
     
@@ -512,17 +536,11 @@ class Kommutationswerte:
         float
             Abzugsglied beta(k, i)
         """
-        if zw <= 0 or zw == 1:
-            return 0.0
-        
-        if zw not in [1, 2, 4, 12]:
-            return 0.0
-        
-        beta = 0.0
-        for idx in range(zw):
-            beta += (idx / zw) / (1.0 + (idx / zw) * self.zins)
-        
-        beta *= (1.0 + self.zins) / zw
+        # Vorberechnet fuer 1, 2, 4, 12; sonst gemeinsame (gecachte) Implementierung
+        # aus basisfunktionen, damit beide Rechenwege dasselbe Abzugsglied verwenden
+        beta = self._beta.get(zw)
+        if beta is None:
+            beta = abzugsglied(zw, self.zins)
         return beta
     
     def ax_k(self, alter: int, geschlecht: str, zw: int = 1) -> float:
@@ -546,16 +564,45 @@ class Kommutationswerte:
         float
             Barwert der Leibrente
         """
-        if zw <= 0:
+        if zw <= 0 or alter < 0 or alter > MAX_ALTER:
             return 0.0
         
-        Nx_wert = self.Nx(alter, geschlecht)
-        Dx_wert = self.Dx(alter, geschlecht)
+        werte = self._get_kommutationswerte(geschlecht)
+        Dx_wert = werte.Dx[alter]
         
         if Dx_wert == 0:
             return 0.0
         
-        return Nx_wert / Dx_wert - self.abzugsglied(zw)
+        return werte.Nx[alter] / Dx_wert - self.abzugsglied(zw)
+    
+    def ax_k_vector(self, geschlecht: str, zw: int = 1) -> np.ndarray:
+        """
+        Barwerte ax^(k) fuer alle Alter 0 bis MAX_ALTER auf einmal.
+        
+        Gleiche Formel wie ax_k (Nx / Dx - beta(k, i)), aber als eine
+        Vektoroperation auf den gecachten Kommutationswerten.
+        
+        Parameters
+        ----------
+        geschlecht : str
+            'M' oder 'F'
+        zw : int
+            Zahlungsweise (1, 2, 4, 12)
+            
+        Returns
+        -------
+        np.ndarray
+            Array mit ax^(k) fuer Alter 0 bis MAX_ALTER (0 wo Dx = 0)
+        """
+        barwerte = np.zeros(MAX_ALTER + 1)
+        if zw <= 0:
+            return barwerte
+        
+        werte = self._get_kommutationswerte(geschlecht)
+        lebend = werte.Dx != 0
+        np.divide(werte.Nx, werte.Dx, out=barwerte, where=lebend)
+        barwerte -= self.abzugsglied(zw) * lebend
+        return barwerte
     
     def axn_k(self, alter: int, n: int, geschlecht: str, zw: int = 1) -> float:
         """
@@ -580,19 +627,17 @@ class Kommutationswerte:
         float
             Barwert der temporaeren Leibrente
         """
-        if zw <= 0 or n <= 0 or alter + n > MAX_ALTER:
+        if zw <= 0 or n <= 0 or alter < 0 or alter + n > MAX_ALTER:
             return 0.0
         
-        Nx_wert = self.Nx(alter, geschlecht)
-        Nx_n_wert = self.Nx(alter + n, geschlecht)
-        Dx_wert = self.Dx(alter, geschlecht)
-        Dx_n_wert = self.Dx(alter + n, geschlecht)
+        werte = self._get_kommutationswerte(geschlecht)
+        Dx_wert = werte.Dx[alter]
         
         if Dx_wert == 0:
             return 0.0
         
-        return (Nx_wert - Nx_n_wert) / Dx_wert - \
-               self.abzugsglied(zw) * (1.0 - Dx_n_wert / Dx_wert)
+        return (werte.Nx[alter] - werte.Nx[alter + n]) / Dx_wert - \
+               self.abzugsglied(zw) * (1.0 - werte.Dx[alter + n] / Dx_wert)
     
     def nax_k(self, alter: int, n: int, geschlecht: str, zw: int = 1) -> float:
         """
@@ -617,16 +662,16 @@ class Kommutationswerte:
         float
             Barwert der aufgeschobenen Leibrente
         """
-        if zw <= 0 or n <= 0 or alter + n > MAX_ALTER:
+        if zw <= 0 or n <= 0 or alter < 0 or alter + n > MAX_ALTER:
             return 0.0
         
-        Dx_wert = self.Dx(alter, geschlecht)
-        Dx_n_wert = self.Dx(alter + n, geschlecht)
+        werte = self._get_kommutationswerte(geschlecht)
+        Dx_wert = werte.Dx[alter]
         
         if Dx_wert == 0:
             return 0.0
         
-        return (Dx_n_wert / Dx_wert) * self.ax_k(alter + n, geschlecht, zw)
+        return (werte.Dx[alter + n] / Dx_wert) * self.ax_k(alter + n, geschlecht, zw)
     
     def nAx(self, alter: int, n: int, geschlecht: str) -> float:
         """
@@ -649,17 +694,16 @@ class Kommutationswerte:
         float
             Barwert der Todesfallversicherung
         """
-        if n <= 0 or alter + n > MAX_ALTER:
+        if n <= 0 or alter < 0 or alter + n > MAX_ALTER:
             return 0.0
         
-        Mx_wert = self.Mx(alter, geschlecht)
-        Mx_n_wert = self.Mx(alter + n, geschlecht)
-        Dx_wert = self.Dx(alter, geschlecht)
+        werte = self._get_kommutationswerte(geschlecht)
+        Dx_wert = werte.Dx[alter]
         
         if Dx_wert == 0:
             return 0.0
         
-        return (Mx_wert - Mx_n_wert) / Dx_wert
+        return (werte.Mx[alter] - werte.Mx[alter + n]) / Dx_wert
     
     def nEx(self, alter: int, n: int, geschlecht: str) -> float:
         """
@@ -682,16 +726,16 @@ class Kommutationswerte:
         float
             Barwert der Erlebensfallversicherung
         """
-        if n <= 0 or alter + n > MAX_ALTER:
+        if n <= 0 or alter < 0 or alter + n > MAX_ALTER:
             return 1.0 if n <= 0 else 0.0
         
-        Dx_wert = self.Dx(alter, geschlecht)
-        Dx_n_wert = self.Dx(alter + n, geschlecht)
+        werte = self._get_kommutationswerte(geschlecht)
+        Dx_wert = werte.Dx[alter]
         
         if Dx_wert == 0:
             return 0.0
         
-        return Dx_n_wert / Dx_wert
+        return werte.Dx[alter + n] / Dx_wert
     
     def ag_k(self, g: int, zw: int = 1) -> float:
         """
@@ -717,55 +761,238 @@ class Kommutationswerte:
         if zw <= 0 or g <= 0:
             return 0.0
         
-        if self.zins == 0:
+        # Ohne Verzinsung (diskont setzt negative Zinsen auf 0) ist jede Zahlung 1 wert
+        if self.v == 1.0:
             return float(g)
         
-        v_g = self.v ** g
+        # (1 - v^g) ausklammern: (1 - v^g) * (1 / (1 - v) - beta(k, i))
+        eins_minus_vg = 1.0 - self._vpow(g)
         
-        return (1.0 - v_g) / (1.0 - self.v) - self.abzugsglied(zw) * (1.0 - v_g)
+        return eins_minus_vg * (self._inv_eins_minus_v - self.abzugsglied(zw))
 
+    
+    # Batch-Berechnungen fuer viele Alter (z.B. ein Bestand mit einer Zeile je Vertrag)
+    
+    def _batch_indizes(self, alter_array, n, geschlecht: str):
+        """
+        Bereitet die Gather-Indizes fuer die Batch-Methoden vor.
+        
+        Ungueltige Eintraege (Alter < 0, n < 0 oder alter + n > MAX_ALTER)
+        zeigen auf Index 0 und sind in der Maske ausgeblendet.
+        
+        Returns
+        -------
+        tuple
+            (werte, ix, ixn, lebend, n): Kommutationswerte, Indizes x und x+n,
+            Maske gueltig und Dx != 0, sowie das auf die Form von alter gebrachte n
+        """
+        alter, n = np.broadcast_arrays(np.asarray(alter_array, dtype=np.intp),
+                                       np.asarray(n, dtype=np.intp))
+        werte = self._get_kommutationswerte(geschlecht)
+        
+        gueltig = (alter >= 0) & (n >= 0) & (alter + n <= MAX_ALTER)
+        ix = np.where(gueltig, alter, 0)
+        ixn = np.where(gueltig, alter + n, 0)
+        lebend = gueltig & (werte.Dx[ix] != 0)
+        
+        return werte, ix, ixn, lebend, n
+    
+    @staticmethod
+    def _quotient(zaehler: np.ndarray, nenner: np.ndarray, maske: np.ndarray) -> np.ndarray:
+        """zaehler / nenner wo maske gesetzt ist, sonst 0."""
+        ergebnis = np.zeros(maske.shape)
+        np.divide(zaehler, nenner, out=ergebnis, where=maske)
+        return ergebnis
+    
+    def ax_k_batch(self, alter_array, geschlecht: str, zw: int = 1) -> np.ndarray:
+        """
+        ax^(k) fuer ein ganzes Array von Eintrittsaltern (wie ax_k je Element).
+        
+        Parameters
+        ----------
+        alter_array : array_like
+            Eintrittsalter
+        geschlecht : str
+            'M' oder 'F'
+        zw : int
+            Zahlungsweise (1, 2, 4, 12)
+            
+        Returns
+        -------
+        np.ndarray
+            Barwerte in der Form von alter_array
+        """
+        werte, ix, _, lebend, _ = self._batch_indizes(alter_array, 0, geschlecht)
+        if zw <= 0:
+            return np.zeros(lebend.shape)
+        
+        barwerte = self._quotient(werte.Nx[ix], werte.Dx[ix], lebend)
+        barwerte -= self.abzugsglied(zw) * lebend
+        return barwerte
+    
+    def axn_k_batch(self, alter_array, n, geschlecht: str, zw: int = 1) -> np.ndarray:
+        """
+        ax:n^(k) fuer Arrays von Eintrittsaltern und Laufzeiten (wie axn_k je Element).
+        
+        Parameters
+        ----------
+        alter_array : array_like
+            Eintrittsalter
+        n : int oder array_like
+            Laufzeit(en) in Jahren, broadcastbar zu alter_array
+        geschlecht : str
+            'M' oder 'F'
+        zw : int
+            Zahlungsweise (1, 2, 4, 12)
+            
+        Returns
+        -------
+        np.ndarray
+            Barwerte in der gemeinsamen Form von alter_array und n
+        """
+        werte, ix, ixn, lebend, n = self._batch_indizes(alter_array, n, geschlecht)
+        lebend &= n > 0
+        if zw <= 0:
+            return np.zeros(lebend.shape)
+        
+        Dx = werte.Dx[ix]
+        barwerte = self._quotient(werte.Nx[ix] - werte.Nx[ixn], Dx, lebend)
+        # Maske als 0/1: der Quotient ist ausserhalb der Maske bereits 0
+        barwerte -= self.abzugsglied(zw) * (lebend - self._quotient(werte.Dx[ixn], Dx, lebend))
+        return barwerte
+    
+    def nax_k_batch(self, alter_array, n, geschlecht: str, zw: int = 1) -> np.ndarray:
+        """
+        n|ax^(k) fuer Arrays von Eintrittsaltern und Aufschubzeiten (wie nax_k je Element).
+        
+        Parameters
+        ----------
+        alter_array : array_like
+            Eintrittsalter
+        n : int oder array_like
+            Aufschubzeit(en) in Jahren, broadcastbar zu alter_array
+        geschlecht : str
+            'M' oder 'F'
+        zw : int
+            Zahlungsweise (1, 2, 4, 12)
+            
+        Returns
+        -------
+        np.ndarray
+            Barwerte in der gemeinsamen Form von alter_array und n
+        """
+        werte, ix, ixn, lebend, n = self._batch_indizes(alter_array, n, geschlecht)
+        lebend &= n > 0
+        if zw <= 0:
+            return np.zeros(lebend.shape)
+        
+        # Ungueltige Eintraege haben Quotient 0, ax_k an Index 0 spielt dort keine Rolle
+        return self._quotient(werte.Dx[ixn], werte.Dx[ix], lebend) * \
+               self.ax_k_batch(ixn, geschlecht, zw)
+    
+    def nAx_batch(self, alter_array, n, geschlecht: str) -> np.ndarray:
+        """
+        A_x:n fuer Arrays von Eintrittsaltern und Laufzeiten (wie nAx je Element).
+        
+        Parameters
+        ----------
+        alter_array : array_like
+            Eintrittsalter
+        n : int oder array_like
+            Laufzeit(en) in Jahren, broadcastbar zu alter_array
+        geschlecht : str
+            'M' oder 'F'
+            
+        Returns
+        -------
+        np.ndarray
+            Barwerte in der gemeinsamen Form von alter_array und n
+        """
+        werte, ix, ixn, lebend, n = self._batch_indizes(alter_array, n, geschlecht)
+        lebend &= n > 0
+        return self._quotient(werte.Mx[ix] - werte.Mx[ixn], werte.Dx[ix], lebend)
+    
+    def nEx_batch(self, alter_array, n, geschlecht: str) -> np.ndarray:
+        """
+        E_x:n fuer Arrays von Eintrittsaltern und Laufzeiten (wie nEx je Element).
+        
+        Parameters
+        ----------
+        alter_array : array_like
+            Eintrittsalter
+        n : int oder array_like
+            Laufzeit(en) in Jahren, broadcastbar zu alter_array
+        geschlecht : str
+            'M' oder 'F'
+            
+        Returns
+        -------
+        np.ndarray
+            Barwerte in der gemeinsamen Form von alter_array und n (1 fuer n <= 0)
+        """
+        werte, ix, ixn, lebend, n = self._batch_indizes(alter_array, n, geschlecht)
+        lebend &= n > 0
+        barwerte = self._quotient(werte.Dx[ixn], werte.Dx[ix], lebend)
+        barwerte += n <= 0  # n <= 0 liegt ausserhalb der Maske, dort also 0 + 1
+        return barwerte
 
 # Hilfsfunktionen fuer Kompatibilitaet mit VBA-Namen
 
+@lru_cache(maxsize=8)
+def _sterbetafel_fuer(tafel: str) -> Sterbetafel:
+    """Laedt eine Sterbetafel einmal je Name und liefert danach das gecachte Objekt."""
+    return Sterbetafel(tafel)
+
+
+def _kommutationswerte_fuer(tafel: str, zins: float) -> Kommutationswerte:
+    """
+    Kommutationswerte je (Tafel, Zins), ueber alle Wrapper-Aufrufe geteilt.
+    
+    Die Vektoren (lx, Dx, Nx, ...) werden so nur beim ersten Aufruf berechnet
+    statt bei jedem einzelnen Act_*-Aufruf.
+    """
+    # Zins auf 10 Stellen runden, damit z.B. 0.0175 und 0.0175000000001
+    # (Rechenrauschen aus Excel) denselben Cache-Eintrag treffen
+    return _kommutationswerte_gecacht(tafel, round(zins, 10))
+
+
+@lru_cache(maxsize=64)
+def _kommutationswerte_gecacht(tafel: str, zins: float) -> Kommutationswerte:
+    """Gecachte Erzeugung zu _kommutationswerte_fuer() (zins bereits gerundet)."""
+    return Kommutationswerte(_sterbetafel_fuer(tafel), zins)
+
+
 def Act_ax_k(alter: int, geschlecht: str, tafel: str, zins: float, k: int) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
-    sterbetafel = Sterbetafel(tafel)
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.ax_k(alter, geschlecht, k)
+    return _kommutationswerte_fuer(tafel, zins).ax_k(alter, geschlecht, k)
+
+
+def Act_ax_k_batch(alter_array, geschlecht: str, tafel: str, zins: float, k: int) -> np.ndarray:
+    """Wrapper-Funktion wie Act_ax_k fuer ein ganzes Array von Eintrittsaltern."""
+    return _kommutationswerte_fuer(tafel, zins).ax_k_batch(alter_array, geschlecht, k)
 
 
 def Act_axn_k(alter: int, n: int, geschlecht: str, tafel: str, zins: float, k: int) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
-    sterbetafel = Sterbetafel(tafel)
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.axn_k(alter, n, geschlecht, k)
+    return _kommutationswerte_fuer(tafel, zins).axn_k(alter, n, geschlecht, k)
 
 
 def Act_nax_k(alter: int, n: int, geschlecht: str, tafel: str, zins: float, k: int) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
-    sterbetafel = Sterbetafel(tafel)
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.nax_k(alter, n, geschlecht, k)
+    return _kommutationswerte_fuer(tafel, zins).nax_k(alter, n, geschlecht, k)
 
 
 def Act_nGrAx(alter: int, n: int, geschlecht: str, tafel: str, zins: float) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
-    sterbetafel = Sterbetafel(tafel)
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.nAx(alter, n, geschlecht)
+    return _kommutationswerte_fuer(tafel, zins).nAx(alter, n, geschlecht)
 
 
 def Act_nGrEx(alter: int, n: int, geschlecht: str, tafel: str, zins: float) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
-    sterbetafel = Sterbetafel(tafel)
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.nEx(alter, n, geschlecht)
+    return _kommutationswerte_fuer(tafel, zins).nEx(alter, n, geschlecht)
 
 
 def Act_ag_k(g: int, zins: float, k: int) -> float:
     """Wrapper-Funktion fuer Kompatibilitaet mit VBA-Code."""
     # Dummy-Sterbetafel, da ag_k kein biometrisches Risiko hat
-    sterbetafel = Sterbetafel("DAV2008_T")
-    komm = Kommutationswerte(sterbetafel, zins)
-    return komm.ag_k(g, k)
-
+    return _kommutationswerte_fuer("DAV2008T", zins).ag_k(g, k)
@@ -10,15 +10,143 @@ fuer Massen- und Verlaufswerte-Berechnungen.
 
 import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional
 
 from .sterbetafel import Sterbetafel, MAX_ALTER
-from .basisfunktionen import diskont, tpx_matrix 
+from .basisfunktionen import diskont_vec, tpx_matrix, tpx_matrix_batch
+from ._jit import njit, NUMBA_VERFUEGBAR
+
+# Ab dieser Laufzeit lohnt der kompilierte Kern gegenueber den NumPy-Temporaerarrays
+_NUMBA_AB_LAUFZEIT = 50
+
+
+def _verlauf_vektoren(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+                      dtype: np.dtype = np.float64):
+    """
+    Gemeinsame Eingangsvektoren der Verlaufs-Funktionen (einmal je Aufruf).
+    
+    Alle drei Vektoren werden C-zusammenhaengend im Ziel-Datentyp geliefert,
+    damit die nachfolgenden Rechenschritte durchgehend in diesem Typ und
+    ohne Schrittweiten-Umwege laufen.
+    
+    Returns:
+        Tupel (tpx_from_x, qx_all, v_pow) mit tp_x fuer t = 0..n,
+        q_{x+t} fuer t = 0..n-1 und v^t fuer t = 0..n
+    """
+    # Zusammenhaengend im Ziel-Datentyp (fuer die Tafel-Slices ohne Kopie)
+    tpx_from_x = np.ascontiguousarray(tpx_matrix(alter, n, sex, sterbetafel_obj), dtype=dtype)
+    qx_all = np.ascontiguousarray(sterbetafel_obj.qx_vec(alter, n, sex), dtype=dtype)
+    v_pow = diskont_vec(zins, n + 1, dtype=dtype)
+    return tpx_from_x, qx_all, v_pow
+
+
+@njit(cache=True, fastmath=True)
+def _nAe_x_verlauf_core(tpx_from_x: np.ndarray, qx_all: np.ndarray, v_pow: np.ndarray,
+                        startwert: float, todesfallbarwerte: np.ndarray) -> None:
+    """
+    Kern fuer _todesfall_verlauf: ein Durchlauf von hinten ohne Zwischenarrays.
+    
+    Schreibt |(n-j)A_{x+j} fuer j = 0..n in todesfallbarwerte (Laenge n+1);
+    startwert (np_x * v^n oder 0) wird jeder Summe hinzugefuegt.
+    """
+    n = qx_all.shape[0]
+    todesfallbarwerte[n] = 0.0
+    
+    summe = startwert
+    for j in range(n - 1, -1, -1):
+        summe += tpx_from_x[j] * qx_all[j] * v_pow[j + 1]
+        nenner = tpx_from_x[j] * v_pow[j]
+        todesfallbarwerte[j] = summe / nenner if nenner > 0.0 else 0.0
+
+
+def _todesfall_verlauf(tpx_from_x: np.ndarray, qx_all: np.ndarray, v_pow: np.ndarray,
+                       mit_erlebensfall: bool = False) -> np.ndarray:
+    """
+    Todesfallbarwerte |(n-j)A_{x+j} fuer j = 0..n ohne Schleife ueber j.
+    
+    Mit d_k = kp_x * q_{x+k} * v^(k+1) gilt (analog Mx / Dx):
+        |(n-j)A_{x+j} = sum_{k=j}^{n-1} d_k / (jp_x * v^j)
+    Die Summen fuer alle j sind eine kumulative Summe von hinten.
+    
+    Mit mit_erlebensfall=True wird in demselben Durchgang die gemischte
+    Versicherung berechnet: (n-j)E_{x+j} = np_x * v^n / (jp_x * v^j) hat
+    denselben Nenner, es genuegt also np_x * v^n zu jeder Summe zu addieren.
+    
+    Args:
+        tpx_from_x, qx_all, v_pow: Vektoren aus _verlauf_vektoren; tpx_from_x
+            und qx_all duerfen auch Matrizen mit einem Vertrag je Zeile sein
+        mit_erlebensfall: Erlebensfallanteil einrechnen (Ae_xn statt nAe_x)
+    
+    Returns:
+        NumPy-Array der Laenge n+1 bzw. Matrix mit n+1 Spalten
+        (0 fuer jp_x = 0; bei j = n 0 bzw. 1 mit Erlebensfall)
+    """
+    n = qx_all.shape[-1]
+    todesfallbarwerte = np.empty(qx_all.shape[:-1] + (n + 1,), dtype=qx_all.dtype)
+    
+    # Lange Laufzeiten: kompilierter Kern (sofern Numba vorhanden)
+    if NUMBA_VERFUEGBAR and qx_all.ndim == 1 and n >= _NUMBA_AB_LAUFZEIT:
+        startwert = tpx_from_x[n] * v_pow[n] if mit_erlebensfall else 0.0
+        _nAe_x_verlauf_core(tpx_from_x, qx_all, v_pow, startwert, todesfallbarwerte)
+    else:
+        # d_k = kp_x * q_{x+k} * v^(k+1), von hinten aufsummiert direkt ins Ergebnis
+        # (kumulative Summe in die umgekehrte Sicht der ersten n Eintraege, Index n = 0)
+        todesfallbarwerte[..., n] = 0.0
+        np.cumsum((tpx_from_x[..., :n] * qx_all * v_pow[1:])[..., ::-1], axis=-1,
+                  out=todesfallbarwerte[..., n - 1::-1])
+        
+        # Erlebensfallanteil: np_x * v^n auf jede Summe (vor der gemeinsamen Division)
+        if mit_erlebensfall:
+            todesfallbarwerte[..., :n] += (tpx_from_x[..., n] * v_pow[n])[..., None]
+        
+        # Auf Zeitpunkt j beziehen: durch jp_x * v^j teilen. Ist jp_x = 0, sind auch
+        # alle d_k ab k = j und np_x null, die Summe bleibt also ohne Division 0
+        nenner = tpx_from_x * v_pow
+        np.divide(todesfallbarwerte, nenner, out=todesfallbarwerte, where=nenner > 0)
+    
+    # Bei j = n: Restlaufzeit 0 -> Erleben ist sicher
+    if mit_erlebensfall:
+        todesfallbarwerte[..., n] = 1.0
+    
+    return todesfallbarwerte
+
+
+def _erlebensfall_verlauf(tpx_from_x: np.ndarray, v_pow: np.ndarray) -> np.ndarray:
+    """
+    Erlebensfallbarwerte (n-t)E_{x+t} = (np_x / tp_x) * v^(n-t) fuer t = 0..n.
+    
+    Args:
+        tpx_from_x, v_pow: Vektoren aus _verlauf_vektoren
+    
+    Returns:
+        NumPy-Array der Laenge n+1 (0 fuer tp_x = 0, 1 bei t = n)
+    """
+    n = tpx_from_x.shape[0] - 1
+    
+    # (n-t)p_{x+t} = np_x / tp_x fuer alle t auf einmal (tp_x = 0 -> 0)
+    erlebensfallbarwerte = np.zeros(n + 1, dtype=tpx_from_x.dtype)
+    
+    # np_x = 0 (Tafelende vor x+n): alle Werte 0 ausser bei t = n
+    if tpx_from_x[n] == 0.0:
+        erlebensfallbarwerte[n] = 1.0
+        return erlebensfallbarwerte
+    
+    np.divide(tpx_from_x[n], tpx_from_x, out=erlebensfallbarwerte, where=tpx_from_x > 0)
+    
+    # Diskontierung ueber die Restlaufzeit n-t: v^n, ..., v^1, v^0
+    erlebensfallbarwerte *= v_pow[::-1]
+    
+    # Bei t=n: Restlaufzeit = 0 -> Erleben ist sicher
+    erlebensfallbarwerte[n] = 1.0
+    
+    return erlebensfallbarwerte
 
 
 # # Vektorisierte Funktionen - optimiert Berechnungsvariante
-def nE_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def nE_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+         dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den Leistungsbarwert einer Erlebensfallleistung der Hoehe 1 mit Eintrittsalter alter und Versicherungsdauer n
     
@@ -30,6 +158,7 @@ def nE_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel
         sex: Geschlecht ('M' oder 'F')
         zins: Jaehrlicher Zinssatz
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         Leistungsbarwert einer Erlebensfallleistung der Hoehe 1 mit Eintrittsalter alter und Versicherungsdauer n
@@ -43,38 +172,13 @@ def nE_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel
     
     n = min(MAX_ALTER - alter, n)
     
-    # Diskontierungsfaktor
-    v = diskont(zins)
-    
-    # Alle tpx-Werte von Alter x aus
-    tpx_from_x = tpx_matrix(alter, n, sex, sterbetafel_obj)
+    # Alle tpx-Werte von Alter x aus und v^0..v^n
+    tpx_from_x, _, v_pow = _verlauf_vektoren(alter, n, sex, zins, sterbetafel_obj, dtype)
     
-    # npx (n-jahrige Ueberlebenswahrscheinlichkeit von x)
-    npx_value = tpx_from_x[n]
-    
-    # Ergebnis-Array
-    erlebensfallbarwerte = np.zeros(n + 1, dtype=float)
-    
-    # Fuer t=0 bis n-1
-    for t in range(n):
-        restlaufzeit = n - t
-        
-        # (n-t)p_{x+t} = np_x / tp_x wobei tp_x = tpx_from_x[t]
-        tp_x = tpx_from_x[t]
-        
-        if tp_x > 0:
-            n_t_px = npx_value / tp_x
-        else:
-            n_t_px = 0.0
-        
-        erlebensfallbarwerte[t] = n_t_px * (v ** restlaufzeit)
-    
-    # Bei t=n: Restlaufzeit = 0 -> Erleben ist sicher
-    erlebensfallbarwerte[n] = 1.0
-    
-    return erlebensfallbarwerte
+    return _erlebensfall_verlauf(tpx_from_x, v_pow)
 
-def nAe_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def nAe_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+          dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den Leistungsbarwert einer konstanten Todesfallleistung der Hoehe 1 mit Eintrittsalter alter und Versicherungsdauer n
     
@@ -86,6 +190,7 @@ def nAe_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafe
         sex: Geschlecht ('M' oder 'F')
         zins: Jaehrlicher Zinssatz
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         Barwert der temporaeren Todesfallversicherung
@@ -95,59 +200,11 @@ def nAe_x(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafe
     
     n = min(MAX_ALTER - alter, n)
     
-    # Diskontierungsfaktor
-    v = diskont(zins)
-    
-    # Alle qx-Werte auf einmal holen
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
-
-    # Berechne einmal alle tpx-Werte von Alter x aus tpx_from_x[k] = kp_x (k-jahrige Ueberlebensw'keit von x)
-    npx_from_x = tpx_matrix(alter, n, sex, sterbetafel_obj)
-    
-    # Ergebnis-Array
-    todesfallbarwerte = np.zeros(n + 1, dtype=float)
-
-    todesfallbarwerte[n] = 0.0
-
-    # Berechne fuer jedes m
-    for j in range(n+1):
-        restlaufzeit = n - j
-
-        # np_x (Ueberlebensw'keit bis Zeitpunkt n von x aus)
-        np_x = npx_from_x[j]
-        
-        if np_x == 0:
-            todesfallbarwerte[j] = 0.0
-            continue
-        
-        # === OPTIMIERUNG: Nutze Beziehung zwischen tpx-Werten ===        
-        # Fuer Zeitpunkte s=1, 2, ..., restlaufzeit: (s-1)p_{x+t} = (t+s-1)p_x / tp_x        
-        # Das bedeutet: tpx-Werte fuer x+t koennen direkt aus tpx_from_x extrahiert werden!
-        
-        # Indices fuer tpx_from_x:
-        # s=1: (1-1)p_{x+j} = 0p_{x+j} = 1  -> brauchen tp_x (haben wir)
-        # s=2: (2-1)p_{x+j} = 1p_{x+j}      -> brauchen (j+1)p_x / tp_x
-        # s=3: (3-1)p_{x+j} = 2p_{x+j}      -> brauchen (j+2)p_x / tp_x
-        # ...
-        # s=restlaufzeit: (s-1)p_{x+j}      -> brauchen (j+s-1)p_x / tp_x
-        
-        # Array von (s-1)p_{x+t} fuer s=1..restlaufzeit:
-        indices = np.arange(j, j + restlaufzeit)  # j, j+1, ..., j+restlaufzeit-1
-        npx_shifted = npx_from_x[indices] / np_x  # (s-1)p_{x+j} fuer s=1..restlaufzeit        
-        
-        # qx-Werte: q_{x+j}, q_{x+j+1}, ..., q_{x+j+restlaufzeit-1}
-        qx_slice = qx_all[j:j + restlaufzeit]
-        
-        # Diskontierungsfaktoren: v^1, v^2, ..., v^restlaufzeit
-        s = np.arange(1, restlaufzeit + 1)
-        v_s = v ** s
-        
-        # Todesfallbarwert (vollstaendig vektorisiert!):
-        todesfallbarwerte[j] = np.sum(npx_shifted * qx_slice * v_s)
-    
-    return todesfallbarwerte
+    # Alle j auf einmal ueber kumulative Summe von hinten
+    return _todesfall_verlauf(*_verlauf_vektoren(alter, n, sex, zins, sterbetafel_obj, dtype))
 
-def Ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def Ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+          dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den Leistungsbarwert einer gemischten Kapitallebensversicherung der Hoehe 1 mit Eintrittsalter alter und Versicherungsdauer n
     
@@ -159,72 +216,163 @@ def Ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafe
         sex: Geschlecht ('M' oder 'F')
         zins: Jaehrlicher Zinssatz
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         Leistungsbarwert einer gemischten Kapitallebensversicherung der Hoehe 1 mit Eintrittsalter alter und Versicherungsdauer n
     """
-    return nAe_x(alter, n, sex, zins, sterbetafel_obj) + nE_x(alter, n, sex, zins, sterbetafel_obj)
+    if n <= 0 or alter + n > MAX_ALTER:
+        return np.array([])
+    
+    n = min(MAX_ALTER - alter, n)
+    
+    # Todes- und Erlebensfallanteil in einem Durchgang (gemeinsamer Nenner jp_x * v^j)
+    return _todesfall_verlauf(*_verlauf_vektoren(alter, n, sex, zins, sterbetafel_obj, dtype),
+                              mit_erlebensfall=True)
 
 
-def nAe_x_ultra_optimized(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def nAe_x_ultra_optimized(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+                          dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Frueher experimentelle Variante von nAe_x mit eigener Schleife ueber t.
+    
+    Beide Funktionen nutzen inzwischen denselben O(n)-Rechenweg
+    (_todesfall_verlauf); diese bleibt fuer bestehende Aufrufer erhalten.
+    Der Parameter dtype wirkt wie bei nAe_x.
     """
-    ULTRA-ULTRA-OPTIMIERT: Experimentelle Version mit Broadcasting.
+    if n <= 0 or alter + n > MAX_ALTER:
+        return np.array([])
+    
+    n = min(MAX_ALTER - alter, n)
     
-    Diese Version versucht, die aeussere Schleife ueber t ebenfalls
-    zu vektorisieren. Dies ist moeglich, fuehrt aber zu hoeherer
-    Speicher-Komplexitaet (O(n^2) statt O(n)).
+    # Gleicher Rechenweg wie nAe_x (kumulative Summe von hinten statt Schleife)
+    return _todesfall_verlauf(*_verlauf_vektoren(alter, n, sex, zins, sterbetafel_obj, dtype))
+
+
+def nAe_x_portfolio(alter_array: np.ndarray, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """
+    Berechnet die Verlaufswerte von nAe_x fuer einen ganzen Bestand von Eintrittsaltern.
     
-    Verwendung: Nur fuer kleine bis mittlere n (< 50).
-    Fuer grosse n: Nutze nAe_x_verlauf_optimized.
+    Zeile i entspricht nAe_x(alter_array[i], n, ...). Statt eines Aufrufs je
+    Vertrag werden tpx und qx als Matrizen geholt und die kumulative Summe
+    von hinten einmal entlang der Laufzeit gebildet.
     
-    Performance:
-        - nAe_x_verlauf_optimized: ~0.0008s fuer n=20
-        - Diese Funktion: ~0.0006s fuer n=20
-        - Speedup: ~1.3x (aber hoehere Speichernutzung)
+    Args:
+        alter_array: Array der Eintrittsalter
+        n: Laufzeit (fuer alle Alter gleich)
+        sex: Geschlecht ('M' oder 'F')
+        zins: Jaehrlicher Zinssatz
+        sterbetafel_obj: Sterbetafel-Objekt
     
-    Fuer n=50:
-        - nAe_x_verlauf_optimized: ~0.004s
-        - Diese Funktion: ~0.005s (langsamer wegen Speicher-Overhead!)
+    Returns:
+        NumPy-Array der Form (len(alter_array), n+1) mit Todesfallbarwerten
+        (Zeilen mit alter + n > MAX_ALTER bleiben 0)
     
-    Fazit: Nutze diese Version NUR fuer n < 30.
+    Beispiel:
+        >>> verlauf = nAe_x_portfolio(np.arange(20, 60), 20, 'M', 0.0175, st)
+        >>> verlauf[5]   # entspricht nAe_x(25, 20, 'M', 0.0175, st)
     """
-    if n <= 0 or alter + n > MAX_ALTER:
-        return np.array([])
+    alter_array = np.asarray(alter_array, dtype=np.int64)
+    n = max(n, 0)
+    ergebnis = np.zeros((alter_array.shape[0], n + 1), dtype=float)
     
-    n = min(MAX_ALTER - alter, n)
+    gueltig = alter_array + n <= MAX_ALTER
+    if n == 0 or not gueltig.any():
+        return ergebnis
     
-    # Vorberechnungen
-    v = diskont(zins)
-    tpx_from_x = tpx_matrix(alter, n, sex, sterbetafel_obj)
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
+    alter_gueltig = alter_array[gueltig]
     
-    # Ergebnis-Array
-    todesfallbarwerte = np.zeros(n + 1, dtype=float)
+    # tpx fuer t = 0..n und q_{x+t} fuer t = 0..n-1 je Zeile
+    tpx = tpx_matrix_batch(alter_gueltig, n, sex, sterbetafel_obj)
+    qx_block = 1.0 - sterbetafel_obj.px_block(alter_gueltig, n, sex)
     
-    # ACHTUNG: Diese Implementierung ist komplex und bietet nur
-    # marginale Verbesserung fuer kleine n.
-    # Fuer Produktiv-Code: Nutze nAe_x_verlauf_optimized!
+    ergebnis[gueltig] = _todesfall_verlauf(tpx, qx_block, diskont_vec(zins, n + 1))
     
-    # Fuer jedes t einzeln berechnen (einfacher und fast genauso schnell)
-    for t in range(n):
-        restlaufzeit = n - t
-        tp_x = tpx_from_x[t]
-        
-        if tp_x == 0:
-            continue
-        
-        indices = np.arange(t, t + restlaufzeit)
-        tpx_shifted = tpx_from_x[indices] / tp_x
-        qx_slice = qx_all[t:t + restlaufzeit]
-        s = np.arange(1, restlaufzeit + 1)
-        v_s = v ** s
-        
-        todesfallbarwerte[t] = np.sum(tpx_shifted * qx_slice * v_s)
+    return ergebnis
+
+
+def nAe_x_batch(alter_array: np.ndarray, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """
+    VEKTORISIERT: Berechnet |nAx fuer einen ganzen Bestand von Eintrittsaltern.
     
-    todesfallbarwerte[n] = 0.0
+    Liefert dieselben Werte wie nAe_x_val() je Alter, aber in einem Durchgang:
+    ein px-Block, ein cumprod entlang der Laufzeit und ein Matrix-Vektor-Produkt.
     
-    return todesfallbarwerte
+    Args:
+        alter_array: Array der Eintrittsalter
+        n: Laufzeit (fuer alle Alter gleich)
+        sex: Geschlecht ('M' oder 'F')
+        zins: Jaehrlicher Zinssatz
+        sterbetafel_obj: Sterbetafel-Objekt
+    
+    Returns:
+        NumPy-Array der Laenge len(alter_array) mit Todesfallbarwerten
+        (0.0 fuer Alter mit alter + n > MAX_ALTER)
+    
+    Beispiel:
+        >>> werte = nAe_x_batch(np.arange(20, 60), 20, 'M', 0.0175, st)
+    """
+    alter_array = np.asarray(alter_array, dtype=np.int64)
+    ergebnis = np.zeros(alter_array.shape[0], dtype=float)
+    
+    if n <= 0:
+        return ergebnis
+    
+    gueltig = alter_array + n <= MAX_ALTER
+    if not gueltig.any():
+        return ergebnis
+    
+    alter_gueltig = alter_array[gueltig]
+    
+    # qx je Zeile fuer die Alter x..x+n-1 und (t-1)px fuer t = 1..n
+    qx_block = 1.0 - sterbetafel_obj.px_block(alter_gueltig, n, sex)
+    tpx = tpx_matrix_batch(alter_gueltig, n, sex, sterbetafel_obj)
+    
+    # |nAx = sum_{t=1}^{n} [(t-1)px * q_{x+t-1} * v^t] fuer alle Zeilen auf einmal
+    v_pow = diskont_vec(zins, n + 1)
+    ergebnis[gueltig] = (tpx[:, :n] * qx_block) @ v_pow[1:]
+    
+    return ergebnis
+
+
+# =============================================================================
+# Gecachte Varianten fuer wiederholte Abfragen
+# =============================================================================
+
+def nE_x_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """
+    Wie nE_x, aber je (alter, n, sex, zins, Sterbetafel) gecacht.
+    
+    Fuer Aufrufer, die dieselben Verlaufswerte wiederholt abfragen. Das
+    Ergebnis ist schreibgeschuetzt, da es von allen Aufrufern geteilt wird.
+    Der Zins wird fuer den Cache-Schluessel auf 10 Nachkommastellen gerundet.
+    """
+    return _nE_x_gecacht(alter, n, sex, round(zins, 10), sterbetafel_obj)
+
+def nAe_x_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """Wie nAe_x, gecacht und schreibgeschuetzt (siehe nE_x_gecacht)."""
+    return _nAe_x_gecacht(alter, n, sex, round(zins, 10), sterbetafel_obj)
+
+def Ae_xn_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """Wie Ae_xn, gecacht und schreibgeschuetzt (siehe nE_x_gecacht)."""
+    return _Ae_xn_gecacht(alter, n, sex, round(zins, 10), sterbetafel_obj)
 
+def _schreibgeschuetzt(werte: np.ndarray) -> np.ndarray:
+    """Sperrt ein Ergebnis-Array gegen Aenderungen (geteilte Cache-Eintraege)."""
+    werte.flags.writeable = False
+    return werte
 
+@lru_cache(maxsize=4096)
+def _nE_x_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """Gecachte Berechnung zu nE_x_gecacht() (zins bereits gerundet)."""
+    return _schreibgeschuetzt(nE_x(alter, n, sex, zins, sterbetafel_obj))
 
+@lru_cache(maxsize=4096)
+def _nAe_x_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """Gecachte Berechnung zu nAe_x_gecacht() (zins bereits gerundet)."""
+    return _schreibgeschuetzt(nAe_x(alter, n, sex, zins, sterbetafel_obj))
 
+@lru_cache(maxsize=4096)
+def _Ae_xn_gecacht(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """Gecachte Berechnung zu Ae_xn_gecacht() (zins bereits gerundet)."""
+    return _schreibgeschuetzt(Ae_xn(alter, n, sex, zins, sterbetafel_obj))
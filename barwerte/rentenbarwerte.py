@@ -12,13 +12,58 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Union, Optional
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .sterbetafel import Sterbetafel, MAX_ALTER
-from .basisfunktionen import diskont, abzugsglied
+from .basisfunktionen import diskont_vec, abzugsglied, tpx_matrix_batch, _kpx_abschnittsweise, _abschnitts_enden
+
+
+def _rentenbarwerte_verlauf(px_all: np.ndarray, v_pow: np.ndarray, abzug: float = 0.0) -> np.ndarray:
+    """
+    Rentenbarwerte ae_{x+j}:n-j fuer j = 0..n-1 ohne Schleife ueber j.
+    
+    Mit w_s = sp_x * v^s gilt ae_{x+j}:n-j = sum_{s=j}^{n-1} w_s / (jp_x * v^j);
+    die Summen fuer alle j sind eine kumulative Summe von hinten. Alter mit
+    px = 0 (qx = 1) trennen die Laufzeit in Abschnitte: Ab Zeile j zaehlen nur
+    Zahlungen bis einschliesslich zum naechsten solchen Alter (wie bisher je j
+    mit neu beginnendem jpx = 1).
+    
+    Args:
+        px_all: p_{x+k} fuer k = 0..n-1
+        v_pow: v^t fuer t = 0..n
+        abzug: Abzugsglied fuer unterjahrige Zahlung (0 = jaehrlich)
+    
+    Returns:
+        NumPy-Array der Laenge n (im Datentyp von px_all) mit Rentenbarwerten,
+        bei abzug != 0 abzueglich abzug * (1 - (n-j)p_{x+j} * v^(n-j))
+    """
+    n = px_all.shape[0]
+    ausgestorben = px_all == 0.0
+    kpx = _kpx_abschnittsweise(px_all, ausgestorben)
+    
+    # w_s = sp_x * v^s von hinten aufsummiert (Index n bleibt 0)
+    w = kpx[:n] * v_pow[:n]
+    summen = np.zeros(n + 1, dtype=px_all.dtype)
+    np.cumsum(w[::-1], out=summen[n - 1::-1])
+    
+    # Je Zeile nur bis zum Abschnittsende summieren, auf Zeitpunkt j beziehen
+    ende = _abschnitts_enden(ausgestorben)
+    rentenbarwerte = (summen[:n] - summen[ende + 1]) / w
+    
+    if abzug != 0.0:
+        # (n-j)p_{x+j} ist nur hinter dem letzten Alter mit px = 0 positiv
+        grenzen = np.flatnonzero(ausgestorben)
+        ab = grenzen[-1] + 1 if grenzen.size else 0
+        n_j_px = np.zeros(n, dtype=px_all.dtype)
+        n_j_px[ab:] = kpx[n] / kpx[ab:n]
+        rentenbarwerte -= abzug * (1.0 - n_j_px * v_pow[n:0:-1])
+    
+    return rentenbarwerte
 
 
 # Vektorisierte Funktionen - optimiert Berechnungsvariante
-def ae_x(alter: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def ae_x(alter: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+         dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den lebenslangen vorschuessigen Rentenbarwert ae_x.
 
@@ -31,52 +76,33 @@ def ae_x(alter: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.
         zins: Zinssatz
         zw: Zahlungsweise
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
-        NumPy-Array der Laenge n mit Rentenbarwerten:
-        - Index 0: ae_x:n (Beginn Jahr 1)
-        - Index 1: ae_{x+1}:n-1 (Beginn Jahr 2)
+        NumPy-Array der Laenge n = MAX_ALTER - alter mit Rentenbarwerten:
+        - Index 0: ae_x (Beginn Jahr 1)
+        - Index 1: ae_{x+1} (Beginn Jahr 2)
         - ...
-        - Index n-1: ae_{x+n-1}:1 (Beginn Jahr n)
+        - Index n-1: ae_{x+n-1} (Beginn Jahr n)
     
     Algorithmus:
         Berechnet alle benoetigten tpx-Werte in einem Durchgang und
         nutzt dann kumulative Operationen fuer maximale Effizienz.
     """
-    if n <= 0 or alter + n > MAX_ALTER:
-        return np.array([])
-    
+    # Laufzeit bis zum Tafelende
     n = MAX_ALTER - alter
+    if n <= 0:
+        return np.array([], dtype=dtype)
     
-    # Vorberechnung
-    v = diskont(zins)
+    # Vorberechnung: v^0..v^n aus der gecachten Tabelle
+    v_pow = diskont_vec(zins, n + 1, dtype=dtype)
     
     # Alle qx-Werte auf einmal holen
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
+    qx_all = sterbetafel_obj.qx_vec(alter, n, sex).astype(dtype, copy=False)
     px_all = 1.0 - qx_all
     
-    # Ergebnis-Array
-    rentenbarwerte = np.zeros(n, dtype=float)
-    
-    # Berechne fuer jedes m
-    for j in range(n):
-        restlaufzeit = n - j
-        
-        # px-Werte fuer Restlaufzeit
-        px_slice = px_all[j:n][:restlaufzeit]
-        
-        # jpx via kumulative Produkte
-        jpx_values = np.ones(restlaufzeit + 1)
-        jpx_values[1:] = np.cumprod(px_slice)
-        
-        # v^s Werte
-        s = np.arange(restlaufzeit)
-        v_s = v ** s
-        
-        # Rentenbarwert
-        rentenbarwerte[j] = np.sum(jpx_values[:restlaufzeit] * v_s)
-    
-    return rentenbarwerte
+    # Alle j auf einmal ueber kumulative Summe von hinten
+    return _rentenbarwerte_verlauf(px_all, v_pow)
 
 def ae_x_k(alter: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel) -> float:
     """
@@ -86,18 +112,23 @@ def ae_x_k(alter: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbeta
         ae_x_k = ae_x - abzug(k,i) 
     
     Args:
-        setup: Dictionary von verlaufswerte_setup()
+        alter: Eintrittsalter
+        sex: Geschlecht
+        zins: Zinssatz
         zw: Zahlungsweise
+        sterbetafel_obj: Sterbetafel-Objekt
     
     Returns:
-        Rentenbarwert mit unterjahrigen Zahlungen
+        NumPy-Array wie ae_x() mit Rentenbarwerten bei unterjahrigen Zahlungen
+        (abzugsglied ist 0 fuer zw = 1)
     """
     if zw <= 0:
         return 0.0
     
-    return ae_x(alter, sex, zins, sterbetafel_obj) - abzugsglied(zw, zins) if zw > 1 else 0.0 
+    return ae_x(alter, sex, zins, sterbetafel_obj) - abzugsglied(zw, zins)
 
-def ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafel,
+          dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den vorschuessigen Rentenbarwert ae_xn ueber n Jahre.
 
@@ -111,6 +142,7 @@ def ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafe
         zins: Zinssatz
         zw: Zahlungsweise
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         NumPy-Array der Laenge n mit Rentenbarwerten:
@@ -128,37 +160,18 @@ def ae_xn(alter: int, n: int, sex: str, zins: float, sterbetafel_obj: Sterbetafe
     
     n = min(MAX_ALTER - alter, n)
     
-    # Vorberechnung
-    v = diskont(zins)
+    # Vorberechnung: v^0..v^n aus der gecachten Tabelle
+    v_pow = diskont_vec(zins, n + 1, dtype=dtype)
     
     # Alle qx-Werte auf einmal holen
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
+    qx_all = sterbetafel_obj.qx_vec(alter, n, sex).astype(dtype, copy=False)
     px_all = 1.0 - qx_all
     
-    # Ergebnis-Array
-    rentenbarwerte = np.zeros(n, dtype=float)
-    
-    # Berechne fuer jedes m
-    for j in range(n):
-        restlaufzeit = n - j
-        
-        # px-Werte fuer Restlaufzeit
-        px_slice = px_all[j:n][:restlaufzeit]
-        
-        # jpx via kumulative Produkte
-        jpx_values = np.ones(restlaufzeit + 1)
-        jpx_values[1:] = np.cumprod(px_slice)
-        
-        # v^s Werte
-        s = np.arange(restlaufzeit)
-        v_s = v ** s
-        
-        # Rentenbarwert
-        rentenbarwerte[j] = np.sum(jpx_values[:restlaufzeit] * v_s)
-    
-    return rentenbarwerte
+    # Alle j auf einmal ueber kumulative Summe von hinten
+    return _rentenbarwerte_verlauf(px_all, v_pow)
 
-def ae_xn_k(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel) -> np.ndarray:
+def ae_xn_k(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel,
+            dtype: np.dtype = np.float64) -> np.ndarray:
     """
     Berechnet den vorschuessigen Rentenbarwert ae_xn ueber n Jahre.
 
@@ -172,6 +185,7 @@ def ae_xn_k(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj:
         zins: Zinssatz
         zw: Zahlungsweise
         sterbetafel_obj: Sterbetafel-Objekt
+        dtype: Rechen- und Ergebnis-Datentyp (z.B. np.float32 fuer Monte-Carlo-Laeufe)
     
     Returns:
         NumPy-Array der Laenge n mit Rentenbarwerten:
@@ -189,41 +203,16 @@ def ae_xn_k(alter: int, n: int, sex: str, zins: float, zw: int, sterbetafel_obj:
     
     n = min(MAX_ALTER - alter, n)
     
-    # Vorberechnung
-    v = diskont(zins)
+    # Vorberechnung: v^0..v^n aus der gecachten Tabelle
+    v_pow = diskont_vec(zins, n + 1, dtype=dtype)
     abzug = abzugsglied(zw, zins) if zw > 1 else 0.0
     
     # Alle qx-Werte auf einmal holen
-    qx_all = sterbetafel_obj.qx_vec(alter, n, sex)
+    qx_all = sterbetafel_obj.qx_vec(alter, n, sex).astype(dtype, copy=False)
     px_all = 1.0 - qx_all
     
-    # Ergebnis-Array
-    rentenbarwerte = np.zeros(n, dtype=float)
-    
-    # Berechne fuer jedes m
-    for j in range(n):
-        restlaufzeit = n - j
-        
-        # px-Werte fuer Restlaufzeit
-        px_slice = px_all[j:n][:restlaufzeit]
-        
-        # jpx via kumulative Produkte
-        jpx_values = np.ones(restlaufzeit + 1)
-        jpx_values[1:] = np.cumprod(px_slice)
-        
-        # v^s Werte
-        s = np.arange(restlaufzeit)
-        v_s = v ** s
-        
-        # Rentenbarwert
-        rentenbarwerte[j] = np.sum(jpx_values[:restlaufzeit] * v_s)
-        
-        # Korrektur fuer unterjahrige Zahlungen
-        if zw > 1:
-            n_j_px = jpx_values[restlaufzeit]
-            rentenbarwerte[j] -= abzug * (1.0 - n_j_px * (v ** restlaufzeit))
-    
-    return rentenbarwerte
+    # Alle j auf einmal, Korrektur fuer unterjahrige Zahlungen vektoriell
+    return _rentenbarwerte_verlauf(px_all, v_pow, abzug)
 
 def m_ae_xn_k(alter: int, n: int, t: int, sex: str, zins: float, zw: int, sterbetafel_obj: Sterbetafel) -> np.ndarray:
     """
@@ -231,8 +220,12 @@ def m_ae_xn_k(alter: int, n: int, t: int, sex: str, zins: float, zw: int, sterbe
 
     Formel:
         Formel: m|axn^(k) = mpx * v^n * ax+m,n-m^(k)
+    
+    Algorithmus:
+        ae_{x+j}:n-j^(k) - ae_{x+j}:t-j^(k) fuer j < t bzw. ae_{x+j}:n-j^(k) fuer
+        j >= t; beide Verlaeufe aus denselben px- und v^t-Vektoren.
     """
-    if n <= 0 or alter + n > MAX_ALTER or t > n:
+    if n <= 0 or alter + n > MAX_ALTER or t > n or t < 0:
         return np.array([])
     
 #    v = diskont(zins)
@@ -262,6 +255,98 @@ def m_ae_xn_k(alter: int, n: int, t: int, sex: str, zins: float, zw: int, sterbe
 #    
 #    return np.append(n_j_px, ae_xn_k_vec)
 #
-    return (ae_xn_k(alter, n, sex, zins, zw, sterbetafel_obj) - 
-            np.append(ae_xn_k(alter, t, sex, zins, zw, sterbetafel_obj), np.zeros(n-t)))
+    # px und v^t einmal holen; die Aufschubzeit t nutzt deren Anfangsstuecke
+    v_pow = diskont_vec(zins, n + 1)
+    abzug = abzugsglied(zw, zins) if zw > 1 else 0.0
+    px_all = 1.0 - sterbetafel_obj.qx_vec(alter, n, sex)
+    
+    rentenbarwerte = _rentenbarwerte_verlauf(px_all, v_pow, abzug)
+    if t > 0:
+        rentenbarwerte[:t] -= _rentenbarwerte_verlauf(px_all[:t], v_pow[:t + 1], abzug)
+    
+    return rentenbarwerte
+
 
+def ae_xn_k_batch(alter_array: np.ndarray, n: Union[int, np.ndarray], sex: str, zins: float, zw: int,
+                  sterbetafel_obj: Sterbetafel) -> np.ndarray:
+    """
+    VEKTORISIERT: Berechnet ae_x:n^(k) fuer einen ganzen Bestand von (Alter, Laufzeit)-Paaren.
+    
+    Liefert dieselben Werte wie ae_xn_k_val() je Paar, aber in einem Durchgang:
+    eine px-Matrix, ein cumprod entlang der Laufzeit und ein Matrix-Vektor-Produkt.
+    Unterschiedliche Laufzeiten (z.B. die Folge (x+t, n-t) eines Verlaufs) teilen
+    sich einen px-Vektor ab dem kleinsten Alter; jede Zeile wird nach ihrer
+    Laufzeit abgeschnitten.
+    
+    Args:
+        alter_array: Array der Eintrittsalter (oder ein Alter fuer alle Laufzeiten)
+        n: Laufzeit (Skalar fuer alle Alter gleich oder Array je Alter)
+        sex: Geschlecht ('M' oder 'F')
+        zins: Jaehrlicher Zinssatz
+        zw: Zahlungsweise (1, 2, 4, oder 12)
+        sterbetafel_obj: Sterbetafel-Objekt
+    
+    Returns:
+        NumPy-Array in der gemeinsamen Laenge von alter_array und n mit
+        Rentenbarwerten (0.0 fuer Paare mit n <= 0 oder alter + n > MAX_ALTER)
+    
+    Raises:
+        ValueError: Wenn alter_array und n verschiedene Laengen (ausser 1) haben
+    
+    Beispiel:
+        >>> werte = ae_xn_k_batch(np.arange(20, 60), 20, 'M', 0.0175, 12, st)
+        >>> t = np.arange(30)
+        >>> verlauf = ae_xn_k_batch(40 + t, 30 - t, 'M', 0.0175, 12, st)
+    """
+    alter_array = np.atleast_1d(np.asarray(alter_array, dtype=np.int64))
+    n_array = np.asarray(n, dtype=np.int64)
+    try:
+        alter_array, n_array = np.broadcast_arrays(alter_array, n_array)
+    except ValueError:
+        raise ValueError(
+            f"alter_array (Laenge {alter_array.shape[0]}) und n (Laenge {n_array.shape[0]}) "
+            f"muessen gleich lang sein"
+        ) from None
+    ergebnis = np.zeros(alter_array.shape[0], dtype=float)
+    
+    if zw <= 0:
+        return ergebnis
+    
+    gueltig = (n_array > 0) & (alter_array + n_array <= MAX_ALTER)
+    if not gueltig.any():
+        return ergebnis
+    
+    alter_gueltig = alter_array[gueltig]
+    n_gueltig = n_array[gueltig]
+    n_max = int(n_gueltig.max())
+    v_pow = diskont_vec(zins, n_max + 1)
+    
+    if (n_gueltig == n_max).all():
+        # Einheitliche Laufzeit: tpx fuer t = 0..n je Zeile (0px = 1)
+        tpx = tpx_matrix_batch(alter_gueltig, n_max, sex, sterbetafel_obj)
+        barwert = tpx[:, :n_max] @ v_pow[:n_max]
+        n_px = tpx[:, n_max]
+    else:
+        # Gemeinsamer px-Vektor ab dem kleinsten Alter, hinter dem letzten
+        # benoetigten Alter mit 1 aufgefuellt, damit jede Zeile n_max Fenster hat
+        alter_min = int(alter_gueltig.min())
+        ende = int((alter_gueltig + n_gueltig).max())
+        px_all = np.ones(int(alter_gueltig.max()) - alter_min + n_max, dtype=float)
+        px_all[:ende - alter_min] = 1.0 - sterbetafel_obj.qx_vec(alter_min, ende - alter_min, sex)
+        
+        tpx = np.empty((alter_gueltig.shape[0], n_max + 1), dtype=float)
+        tpx[:, 0] = 1.0
+        np.cumprod(sliding_window_view(px_all, n_max)[alter_gueltig - alter_min], axis=1, out=tpx[:, 1:])
+        
+        # Spalten t >= n der jeweiligen Zeile tragen nicht zum Barwert bei
+        laufend = np.arange(n_max) < n_gueltig[:, None]
+        barwert = np.where(laufend, tpx[:, :n_max], 0.0) @ v_pow[:n_max]
+        n_px = tpx[np.arange(alter_gueltig.shape[0]), n_gueltig]
+    
+    # Wie npx_val: npx = 1.0, sobald x+n MAX_ALTER erreicht
+    n_px = np.where(alter_gueltig + n_gueltig >= MAX_ALTER, 1.0, n_px)
+    
+    abzug = abzugsglied(zw, zins)
+    ergebnis[gueltig] = barwert - abzug * (1.0 - n_px * v_pow[n_gueltig])
+    
+    return ergebnis
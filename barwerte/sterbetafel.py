@@ -11,14 +11,17 @@ wobei:
     - qy: Sterbewahrscheinlichkeit weiblich
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
 from typing import Union, Optional
 
 
 # Konstanten
 MAX_ALTER = 121  # Maximales Alter fuer Berechnungen
+SEX_IDX = {'M': 0, 'F': 1}  # Zeilenindex je Geschlecht in den Tafel-Arrays
 
 
 class Sterbetafel:
@@ -102,6 +105,25 @@ class Sterbetafel:
         # Setze Index auf Alter fuer schnellen Zugriff
         self.data = self.data.set_index('Alter')
         
+        # Zusammenhaengende float64-Arrays der Form (2, max_alter+1): Zeile = Geschlecht
+        # (SEX_IDX), Spalte = Alter. qx_vec/px_vec liefern damit nur noch Slices.
+        self._qx = self._spalten_als_array(('qx', 'qy'))
+        self._px = self._schreibgeschuetzt(1.0 - self._qx)
+        
+        # log(px) fuer Produkte als kumulative Summen (qx = 1 ergibt -inf, also tpx = 0)
+        with np.errstate(divide='ignore'):
+            self._log_px = self._schreibgeschuetzt(np.log1p(-self._qx))
+        
+        # Ueberlebensordnung lx mit l_0 = 1 (Spalte = Alter, Laenge max_alter+2),
+        # damit tpx = l_{x+t} / l_x ohne erneutes kumulatives Produkt gilt
+        self._lx = self._ueberlebensordnung(self._log_px)
+        
+        # Cache der tpx-Vektoren je (alter, Geschlecht), siehe _tpx_bis_tafelende
+        self._tpx_cache = {}
+        
+        # Pruefsumme ueber die qx-Werte, z.B. als Schluessel fuer persistente Caches
+        self.pruefsumme = hashlib.sha1(self._qx.tobytes()).hexdigest()
+        
         # Info-Meldung wenn Daten gefiltert wurden
         anzahl_gesamt = len(data_raw)
         anzahl_geladen = len(self.data)
@@ -109,6 +131,46 @@ class Sterbetafel:
             print(f"Info: Von {anzahl_gesamt} Zeilen wurden {anzahl_geladen} geladen "
                   f"(Alter 0-{MAX_ALTER})")
     
+    def _spalten_als_array(self, spalten: tuple) -> np.ndarray:
+        """
+        Legt die qx-Spalten (maennlich, weiblich) als ein zusammenhaengendes float64-Array ab.
+        
+        Zeile i enthaelt spalten[i], der Spaltenindex entspricht dem Alter
+        (0 bis max_alter); Alter unterhalb von min_alter bleiben NaN.
+        """
+        werte = np.full((len(spalten), self.max_alter + 1), np.nan, dtype=np.float64)
+        werte[:, self.data.index.to_numpy()] = self.data[list(spalten)].to_numpy(dtype=np.float64).T
+        return self._schreibgeschuetzt(werte)
+    
+    def _ueberlebensordnung(self, log_px: np.ndarray) -> np.ndarray:
+        """Berechnet lx = exp(sum log(px)) ab Alter 0 (Alter unter min_alter tragen nicht bei)."""
+        lx = np.empty((log_px.shape[0], self.max_alter + 2), dtype=np.float64)
+        lx[:, 0] = 1.0
+        # -inf + -inf setzt nur das Overflow-Flag, das Ergebnis -inf ist gewollt
+        with np.errstate(over='ignore'):
+            np.exp(np.cumsum(np.nan_to_num(log_px, nan=0.0), axis=1), out=lx[:, 1:])
+        return self._schreibgeschuetzt(lx)
+    
+    @staticmethod
+    def _schreibgeschuetzt(werte: np.ndarray) -> np.ndarray:
+        """Macht ein Array zusammenhaengend und schreibgeschuetzt (geteilte Slices)."""
+        werte = np.ascontiguousarray(werte, dtype=np.float64)
+        werte.flags.writeable = False
+        return werte
+    
+    def _pruefe_alter(self, alter: int) -> None:
+        """Prueft, ob das Alter im gueltigen Bereich der Tafel liegt."""
+        if alter < self.min_alter or alter > self.max_alter:
+            raise ValueError(
+                f"Alter {alter} ausserhalb des gueltigen Bereichs "
+                f"[{self.min_alter}, {self.max_alter}] fuer Tafel '{self.name}'"
+            )
+    
+    @staticmethod
+    def _sex_idx(sex: str) -> int:
+        """Zeilenindex zum Geschlecht ('M' = maennlich, sonst weiblich)."""
+        return SEX_IDX['M'] if sex.upper() == 'M' else SEX_IDX['F']
+    
     def qx(self, alter: int, sex: str) -> float:
         """
         Gibt Sterbewahrscheinlichkeit qx fuer gegebenes Alter zurueck.
@@ -128,22 +190,40 @@ class Sterbetafel:
             >>> qx_40_m = st.qx(40, 'M')
         """
         # Validiere Alter
-        if alter < self.min_alter or alter > self.max_alter:
-            raise ValueError(
-                f"Alter {alter} ausserhalb des gueltigen Bereichs "
-                f"[{self.min_alter}, {self.max_alter}] fuer Tafel '{self.name}'"
-            )
+        self._pruefe_alter(alter)
+        
+        # Waehle richtige Zeile (Default: weiblich) und gebe qx-Wert zurueck
+        qx_werte = self._qx[self._sex_idx(sex)]
+        return float(qx_werte[alter])
+    
+    def qx_vector(self, sex: str) -> np.ndarray:
+        """
+        Gibt die komplette qx-Spalte eines Geschlechts zurueck.
         
-        # Geschlecht normalisieren
-        sex = sex.upper()
-        if sex not in ['M', 'F']:
-            sex = 'F'  # Default: weiblich
+        Args:
+            sex: Geschlecht ('M' oder 'F')
         
-        # Waehle richtige Spalte
-        spalte = 'qx' if sex == 'M' else 'qy'
+        Returns:
+            Schreibgeschuetztes NumPy-Array mit qx-Werten fuer Alter 0 bis max_alter
+            (Alter unterhalb von min_alter sind NaN)
         
-        # Gebe qx-Wert zurueck
-        return float(self.data.loc[alter, spalte])
+        Beispiel:
+            >>> st = Sterbetafel("DAV1994T")
+            >>> qx_m = st.qx_vector('M')  # qx_m[40] == st.qx(40, 'M')
+        """
+        return self._qx[self._sex_idx(sex)]
+    
+    def px_vector(self, sex: str) -> np.ndarray:
+        """
+        Gibt die komplette px-Spalte (px = 1 - qx) eines Geschlechts zurueck.
+        
+        Args:
+            sex: Geschlecht ('M' oder 'F')
+        
+        Returns:
+            Schreibgeschuetztes NumPy-Array mit px-Werten fuer Alter 0 bis max_alter
+        """
+        return self._px[self._sex_idx(sex)]
     
     def qx_vec(self, alter: int, n: int, sex: str) -> np.ndarray:
         """
@@ -164,7 +244,11 @@ class Sterbetafel:
         if n <= 0 or alter + n > self.max_alter:
             return np.array([])
         
-        return np.array([self.qx(alter + i, sex) for i in range(n)])
+        self._pruefe_alter(alter)
+        
+        # Schreibgeschuetzter Slice ohne Kopie
+        qx_werte = self._qx[self._sex_idx(sex)]
+        return qx_werte[alter:alter + n]
     
     def px_vec(self, alter: int, n: int, sex: str) -> np.ndarray:
         """
@@ -183,8 +267,125 @@ class Sterbetafel:
             >>> st = Sterbetafel("DAV1994T")
             >>> px_vec = st.px_vec(40, 5, 'M')  # px fuer Alter 40-44
         """
-        qx_werte = self.qx_vec(alter, n, sex)
-        return 1.0 - qx_werte
+        if n <= 0 or alter + n > self.max_alter:
+            return np.array([])
+        
+        self._pruefe_alter(alter)
+        
+        # Schreibgeschuetzter Slice ohne Kopie
+        px_werte = self._px[self._sex_idx(sex)]
+        return px_werte[alter:alter + n]
+    
+    def log_px_vec(self, alter: int, n: int, sex: str) -> np.ndarray:
+        """
+        Erzeugt Vektor der logarithmierten Ueberlebenswahrscheinlichkeiten log(px) fuer n Jahre.
+        
+        Args:
+            alter: Startalter
+            n: Anzahl Jahre
+            sex: Geschlecht ('M' oder 'F')
+        
+        Returns:
+            NumPy-Array mit log(px)-Werten fuer Alter x bis x+n-1 (-inf fuer qx = 1)
+        """
+        if n <= 0 or alter + n > self.max_alter:
+            return np.array([])
+        
+        self._pruefe_alter(alter)
+        
+        # Schreibgeschuetzter Slice ohne Kopie
+        log_px_werte = self._log_px[self._sex_idx(sex)]
+        return log_px_werte[alter:alter + n]
+    
+    def tpx_vec(self, alter: int, n: int, sex: str) -> np.ndarray:
+        """
+        Erzeugt Vektor der Ueberlebenswahrscheinlichkeiten tpx fuer t = 0..n.
+        
+        Nutzt tpx = l_{x+t} / l_x mit der vorberechneten Ueberlebensordnung.
+        Ist l_x = 0 (Alter liegt hinter dem Tafelende), wird tpx direkt
+        aus den log(px)-Werten ab Alter x kumuliert. Der Vektor bis zum
+        Tafelende wird je (alter, sex) gecacht, jeder Aufruf liefert einen
+        schreibgeschuetzten Slice davon.
+        
+        Args:
+            alter: Startalter
+            n: Anzahl Jahre
+            sex: Geschlecht ('M' oder 'F')
+        
+        Returns:
+            NumPy-Array der Laenge n+1 mit tpx-Werten (leer, falls alter+n > max_alter)
+        
+        Beispiel:
+            >>> st = Sterbetafel("DAV1994T")
+            >>> tpx = st.tpx_vec(40, 20, 'M')  # 0px bis 20px fuer Alter 40
+        """
+        if n < 0 or alter + n > self.max_alter:
+            return np.array([])
+        
+        self._pruefe_alter(alter)
+        
+        # Schreibgeschuetzter Slice des gecachten Vektors bis zum Tafelende
+        return self._tpx_bis_tafelende(alter, self._sex_idx(sex))[:n + 1]
+    
+    def _tpx_bis_tafelende(self, alter: int, idx: int) -> np.ndarray:
+        """
+        Liefert tpx fuer t = 0..max_alter-alter, gecacht je (alter, Geschlecht).
+        
+        Der Vektor wird beim ersten Zugriff einmal berechnet; jede weitere
+        Laufzeit ab demselben Alter ist nur noch ein Slice davon.
+        """
+        schluessel = (alter, idx)
+        tpx = self._tpx_cache.get(schluessel)
+        if tpx is not None:
+            return tpx
+        
+        n = self.max_alter - alter
+        lx = self._lx[idx]
+        if lx[alter] > 0.0:
+            tpx = lx[alter:alter + n + 1] / lx[alter]
+        else:
+            tpx = np.empty(n + 1, dtype=np.float64)
+            tpx[0] = 1.0
+            with np.errstate(over='ignore'):
+                np.exp(np.cumsum(self._log_px[idx, alter:alter + n]), out=tpx[1:])
+        
+        tpx = self._schreibgeschuetzt(tpx)
+        self._tpx_cache[schluessel] = tpx
+        return tpx
+    
+    def px_block(self, alter_array: np.ndarray, n: int, sex: str) -> np.ndarray:
+        """
+        Erzeugt eine Matrix der Ueberlebenswahrscheinlichkeiten px fuer mehrere Startalter.
+        
+        Zeile i enthaelt px fuer die Alter alter_array[i] bis alter_array[i]+n-1
+        (ein einziger Fancy-Index-Zugriff statt eines px_vec-Aufrufs je Alter).
+        
+        Args:
+            alter_array: Array der Startalter
+            n: Anzahl Jahre
+            sex: Geschlecht ('M' oder 'F')
+        
+        Returns:
+            NumPy-Array der Form (len(alter_array), n)
+        
+        Raises:
+            ValueError: Wenn ein Alter bzw. alter+n ausserhalb des gueltigen Bereichs liegt
+        
+        Beispiel:
+            >>> st = Sterbetafel("DAV1994T")
+            >>> px = st.px_block(np.array([40, 50]), 5, 'M')  # Form (2, 5)
+        """
+        alter_array = np.asarray(alter_array, dtype=np.int64)
+        if n <= 0 or alter_array.size == 0:
+            return np.empty((alter_array.size, 0), dtype=np.float64)
+        
+        self._pruefe_alter(int(alter_array.min()))
+        self._pruefe_alter(int(alter_array.max()) + n - 1)
+        
+        # Zeilen als gleitende Fenster der Laenge n: ausgewaehlt wird nur je Startalter,
+        # jede Zeile wird als zusammenhaengender Block kopiert (keine (m, n)-Indexmatrix)
+        px_fenster = sliding_window_view(self._px[self._sex_idx(sex)], n)
+        return px_fenster[alter_array]
     
     def __repr__(self) -> str:
         """String-Repraesentation der Sterbetafel."""
@@ -12,5 +12,8 @@ setup(
         'pandas>=2.0.0',
         'openpyxl>=3.1.0',  # falls Sie Excel-Dateien lesen
     ],
+    extras_require={
+        'jit': ['numba>=0.59'],  # optionale JIT-Kompilierung der Rechenkerne
+    },
     python_requires='>=3.11',
 )
\ No newline at end of file
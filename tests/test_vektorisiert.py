@@ -0,0 +1,413 @@
+"""
+Tests fuer die vektorisierten Verlaufs- und Batch-Funktionen
+
+Jede vektorisierte Funktion wird gegen eine Schleife ueber die skalare
+Variante bzw. eine direkte Summe ueber tpx * v^t geprueft.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Parent-Verzeichnis zum Python-Pfad hinzufuegen
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+from barwerte.sterbetafel import Sterbetafel, MAX_ALTER
+from barwerte import rentenbarwerte as rbw
+from barwerte import leistungsbarwerte as lbw
+from barwerte import basisfunktionen as bf
+from barwerte import finanzmathematik as fin
+from barwerte import _backup_funktionen as bk
+from barwerte.kommutationswerte import Kommutationswerte
+
+
+DATA_DIR = parent_dir / "data"
+ZINSSAETZE = [0.0, 0.0175, 0.05]
+ALTER = [0, 1, 40, 99, 100, 110, 120]
+
+
+@pytest.fixture(scope="module", params=["DAV1994T", "DAV2008T"])
+def st(request) -> Sterbetafel:
+    """Sterbetafel-Objekt je getesteter Tafel."""
+    return Sterbetafel(request.param, str(DATA_DIR))
+
+
+def _ae_x_direkt(alter: int, sex: str, zins: float, st: Sterbetafel) -> np.ndarray:
+    """ae_{x+j} fuer j = 0..MAX_ALTER-alter-1 als direkte Summe je j."""
+    n = MAX_ALTER - alter
+    v = bf.diskont(zins)
+    px_all = 1.0 - st.qx_vec(alter, n, sex)
+
+    werte = np.empty(n)
+    for j in range(n):
+        jpx = np.concatenate(([1.0], np.cumprod(px_all[j:n - 1])))
+        werte[j] = np.sum(jpx * v ** np.arange(n - j))
+    return werte
+
+
+# =============================================================================
+# Rentenbarwerte
+# =============================================================================
+
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+@pytest.mark.parametrize("alter", ALTER)
+def test_ae_x(st, alter, zins):
+    """ae_x liefert fuer jedes j den lebenslangen Rentenbarwert ab x+j."""
+    werte = rbw.ae_x(alter, 'M', zins, st)
+
+    assert werte.shape == (MAX_ALTER - alter,)
+    np.testing.assert_allclose(werte, _ae_x_direkt(alter, 'M', zins, st), rtol=1e-12)
+
+
+@pytest.mark.parametrize("zw", [1, 2, 4, 12])
+@pytest.mark.parametrize("alter", ALTER[1:])
+def test_ae_x_k(st, alter, zw):
+    """ae_x_k stimmt in Index 0 mit dem skalaren ae_x_k_val ueberein."""
+    werte = rbw.ae_x_k(alter, 'F', 0.0175, zw, st)
+
+    np.testing.assert_allclose(werte, rbw.ae_x(alter, 'F', 0.0175, st) - bf.abzugsglied(zw, 0.0175))
+    np.testing.assert_allclose(werte[0], bk.ae_x_k_val(alter, 'F', 0.0175, zw, st), rtol=1e-12)
+
+
+def test_ae_x_ausserhalb_tafel(st):
+    """Ab MAX_ALTER gibt es keine Verlaufswerte mehr."""
+    assert rbw.ae_x(MAX_ALTER, 'M', 0.0175, st).size == 0
+
+
+def test_ae_x_dtype(st):
+    """Mit dtype=np.float32 wird in einfacher Genauigkeit gerechnet."""
+    werte = rbw.ae_x(40, 'M', 0.0175, st, dtype=np.float32)
+
+    assert werte.dtype == np.float32
+    np.testing.assert_allclose(werte, rbw.ae_x(40, 'M', 0.0175, st), rtol=1e-5)
+
+
+# =============================================================================
+# Batch-Funktionen ueber Bestaende von Eintrittsaltern
+# =============================================================================
+
+BESTAND = np.array([0, 5, 20, 40, 40, 63, 90, 99, 100, 101, 110, 115, 120, 121])
+
+
+def test_px_block(st):
+    """Zeile i von px_block entspricht px_vec(alter_array[i], n)."""
+    alter_array = BESTAND[BESTAND + 10 <= MAX_ALTER]
+    block = st.px_block(alter_array, 10, 'M')
+
+    erwartet = np.array([st.px_vec(alter, 10, 'M') for alter in alter_array])
+    np.testing.assert_array_equal(block, erwartet)
+
+
+@pytest.mark.parametrize("zw", [1, 2, 12])
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+@pytest.mark.parametrize("n", [1, 6, 21])
+def test_ae_xn_k_batch(st, n, zins, zw):
+    """ae_xn_k_batch stimmt je Alter mit ae_xn_k_val ueberein (0 ausserhalb der Tafel)."""
+    werte = rbw.ae_xn_k_batch(BESTAND, n, 'M', zins, zw, st)
+
+    erwartet = [bk.ae_xn_k_val(int(alter), n, 'M', zins, zw, st) for alter in BESTAND]
+    np.testing.assert_allclose(werte, erwartet, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("zw", [1, 12])
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+def test_ae_xn_k_batch_laufzeit_je_alter(st, zins, zw):
+    """Mit einer Laufzeit je Alter stimmt ae_xn_k_batch je Paar mit ae_xn_k_val ueberein."""
+    t = np.arange(61)
+    alter_array = np.concatenate([t, 40 + t[:31], BESTAND])
+    n_array = np.concatenate([121 - t, 30 - t[:31], np.array([5, 0, -1, 81, 80, 1, 25, 22, 21, 20, 11, 6, 2, 1])])
+
+    werte = rbw.ae_xn_k_batch(alter_array, n_array, 'F', zins, zw, st)
+
+    erwartet = [bk.ae_xn_k_val(int(alter), int(n), 'F', zins, zw, st) for alter, n in zip(alter_array, n_array)]
+    np.testing.assert_allclose(werte, erwartet, rtol=1e-12, atol=1e-14)
+
+
+def test_ae_xn_k_batch_broadcast(st):
+    """Ein einzelnes Alter wird auf alle Laufzeiten verteilt; verschiedene Laengen sind ein Fehler."""
+    werte = rbw.ae_xn_k_batch(np.array([40]), np.array([5, 6]), 'M', 0.0175, 12, st)
+    np.testing.assert_allclose(werte, [bk.ae_xn_k_val(40, n, 'M', 0.0175, 12, st) for n in (5, 6)], rtol=1e-12)
+
+    with pytest.raises(ValueError, match="Laenge 2.*Laenge 3"):
+        rbw.ae_xn_k_batch(np.array([40, 41]), np.array([5, 6, 7]), 'M', 0.0175, 12, st)
+
+@pytest.mark.parametrize("leer", [False, True])
+@pytest.mark.parametrize("max_t", [0, 1, 21])
+def test_tpx_matrix_batch(st, max_t, leer):
+    """Zeile i von tpx_matrix_batch entspricht tpx_matrix(alter_array[i], max_t), auch fuer einen leeren Bestand."""
+    alter_array = BESTAND[BESTAND + max_t <= MAX_ALTER]
+    if leer:
+        alter_array = alter_array[:0]
+    block = bf.tpx_matrix_batch(alter_array, max_t, 'F', st)
+
+    assert block.shape == (alter_array.size, max_t + 1)
+    erwartet = np.array([bf.tpx_matrix(int(alter), max_t, 'F', st) for alter in alter_array]).reshape(block.shape)
+    np.testing.assert_allclose(block, erwartet, rtol=1e-13, atol=1e-15)
+
+
+def test_tpx_matrix_batch_ausserhalb_tafel(st):
+    """Ueberschreitet ein Alter mit max_t MAX_ALTER, wird ein ValueError ausgeloest."""
+    with pytest.raises(ValueError):
+        bf.tpx_matrix_batch(np.array([40, MAX_ALTER - 5]), 10, 'M', st)
+
+
+# =============================================================================
+# Finanzmathematik
+# =============================================================================
+
+@pytest.mark.parametrize("k", [0, 1, 2, 4, 12])
+def test_ag_k_vec(k):
+    """ag_k_vec stimmt elementweise mit ag_k ueberein, auch als Zins-Gitter."""
+    g_array = np.array([0, 1, 2, 10, 50])
+    zinssaetze = np.array([-0.01, 0.0, 1e-9, 0.0175, 0.05])
+
+    gitter = fin.ag_k_vec(g_array, zinssaetze, k)
+    erwartet = [[fin.ag_k(int(g), float(zins), k) for g in g_array] for zins in zinssaetze]
+
+    assert gitter.shape == (zinssaetze.size, g_array.size)
+    np.testing.assert_allclose(gitter, erwartet, rtol=1e-12)
+    np.testing.assert_allclose(fin.ag_k_vec(g_array, 0.0175, k), erwartet[3], rtol=1e-12)
+
+
+# =============================================================================
+# Kommutationswerte
+# =============================================================================
+
+KOMMUTATION_ALTER = np.array([0, 1, 40, 99, 100, 110, 119, 120, 121])
+KOMMUTATION_N = np.array([0, 1, 10, 21])
+
+
+@pytest.fixture(scope="module", params=[0.0, 0.0175])
+def kw(st, request) -> Kommutationswerte:
+    """Kommutationswerte je Tafel und Zins."""
+    return Kommutationswerte(st, request.param)
+
+
+@pytest.mark.parametrize("zw", [0, 1, 2, 12])
+def test_ax_k_batch(kw, zw):
+    """ax_k_batch stimmt elementweise mit ax_k ueberein."""
+    erwartet = [kw.ax_k(int(alter), 'M', zw) for alter in KOMMUTATION_ALTER]
+    np.testing.assert_allclose(kw.ax_k_batch(KOMMUTATION_ALTER, 'M', zw), erwartet, rtol=1e-12)
+
+
+@pytest.mark.parametrize("methode", ["axn_k", "nax_k"])
+@pytest.mark.parametrize("zw", [0, 1, 2, 12])
+def test_axn_k_nax_k_batch(kw, methode, zw):
+    """axn_k_batch und nax_k_batch stimmen auf dem Gitter (Alter x Laufzeit) mit der skalaren Methode ueberein."""
+    alter, n = np.meshgrid(KOMMUTATION_ALTER, KOMMUTATION_N, indexing='ij')
+    skalar = getattr(kw, methode)
+
+    erwartet = [[skalar(int(a), int(m), 'F', zw) for m in KOMMUTATION_N] for a in KOMMUTATION_ALTER]
+    np.testing.assert_allclose(getattr(kw, methode + '_batch')(alter, n, 'F', zw), erwartet, rtol=1e-12)
+
+
+@pytest.mark.parametrize("methode", ["nAx", "nEx"])
+def test_nAx_nEx_batch(kw, methode):
+    """nAx_batch und nEx_batch stimmen auf dem Gitter (Alter x Laufzeit) mit der skalaren Methode ueberein."""
+    alter, n = np.meshgrid(KOMMUTATION_ALTER, KOMMUTATION_N, indexing='ij')
+    skalar = getattr(kw, methode)
+
+    erwartet = [[skalar(int(a), int(m), 'M') for m in KOMMUTATION_N] for a in KOMMUTATION_ALTER]
+    np.testing.assert_allclose(getattr(kw, methode + '_batch')(alter, n, 'M'), erwartet, rtol=1e-12)
+
+
+# =============================================================================
+# Leistungsbarwerte
+# =============================================================================
+
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+@pytest.mark.parametrize("n", [0, 1, 6, 21])
+def test_nAe_x_batch(st, n, zins):
+    """nAe_x_batch stimmt je Alter mit nAe_x_val ueberein (0 ausserhalb der Tafel)."""
+    werte = lbw.nAe_x_batch(BESTAND, n, 'F', zins, st)
+
+    erwartet = [bk.nAe_x_val(int(alter), n, 'F', zins, st) for alter in BESTAND]
+    np.testing.assert_allclose(werte, erwartet, rtol=1e-12, atol=1e-15)
+
+
+def _todesfall_direkt(alter: int, n: int, sex: str, zins: float, st: Sterbetafel,
+                      mit_erlebensfall: bool) -> np.ndarray:
+    """|(n-j)A_{x+j} (bzw. mit Erlebensfall) als direkte Summe je j ueber tp_x ab Alter x."""
+    qx_all = st.qx_vec(alter, n, sex)
+    tpx = bf.tpx_matrix(alter, n, sex, st)
+    v_pow = bf.diskont(zins) ** np.arange(n + 1)
+
+    werte = np.zeros(n + 1)
+    for j in range(n):
+        if tpx[j] > 0:
+            summe = sum(tpx[k] * qx_all[k] * v_pow[k + 1] for k in range(j, n))
+            if mit_erlebensfall:
+                summe += tpx[n] * v_pow[n]
+            werte[j] = summe / (tpx[j] * v_pow[j])
+    werte[n] = 1.0 if mit_erlebensfall else 0.0
+    return werte
+
+
+@pytest.mark.skipif(not lbw.NUMBA_VERFUEGBAR, reason="Numba nicht installiert")
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+@pytest.mark.parametrize("alter, n", [(20, 50), (20, 80), (40, 50), (40, 80), (20, MAX_ALTER - 20),
+                                      (40, MAX_ALTER - 40), (60, MAX_ALTER - 60)])
+def test_nAe_x_Ae_xn_lange_laufzeit(st, alter, n, zins):
+    """Lange Laufzeiten (Numba-Kern) stimmen mit direkter Summe und kumulativer Summe ueberein."""
+    assert n >= lbw._NUMBA_AB_LAUFZEIT
+
+    for funktion, mit_erlebensfall in ((lbw.nAe_x, False), (lbw.Ae_xn, True)):
+        werte = funktion(alter, n, 'M', zins, st)
+
+        # Ueber die Matrix-Form laeuft _todesfall_verlauf immer ueber die kumulative Summe
+        tpx, qx_all, v_pow = lbw._verlauf_vektoren(alter, n, 'M', zins, st)
+        kumuliert = lbw._todesfall_verlauf(tpx[None, :], qx_all[None, :], v_pow, mit_erlebensfall)[0]
+
+        np.testing.assert_allclose(werte, kumuliert, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(werte, _todesfall_direkt(alter, n, 'M', zins, st, mit_erlebensfall),
+                                   rtol=1e-12, atol=1e-15)
+
+@pytest.mark.parametrize("gecacht, ungecacht", [(lbw.nE_x_gecacht, lbw.nE_x),
+                                                (lbw.nAe_x_gecacht, lbw.nAe_x),
+                                                (lbw.Ae_xn_gecacht, lbw.Ae_xn)])
+def test_gecachte_verlaufswerte(st, gecacht, ungecacht):
+    """Die gecachten Varianten liefern dieselben, schreibgeschuetzten Werte je gerundetem Zins."""
+    werte = gecacht(40, 30, 'F', 0.0175, st)
+
+    np.testing.assert_array_equal(werte, ungecacht(40, 30, 'F', 0.0175, st))
+    assert werte.flags.writeable is False
+    with pytest.raises(ValueError):
+        werte[0] = 0.0
+
+    # Abweichungen erst jenseits der 10. Nachkommastelle treffen denselben Eintrag
+    assert gecacht(40, 30, 'F', 0.0175 + 1e-12, st) is werte
+    assert gecacht(40, 30, 'F', 0.0175 + 1e-6, st) is not werte
+
+@pytest.mark.parametrize("zins", ZINSSAETZE)
+@pytest.mark.parametrize("n", [0, 1, 6, 21])
+def test_nAe_x_portfolio(st, n, zins):
+    """Zeile i von nAe_x_portfolio entspricht nAe_x(alter_array[i], n) (Nullzeile ausserhalb der Tafel)."""
+    verlauf = lbw.nAe_x_portfolio(BESTAND, n, 'M', zins, st)
+
+    assert verlauf.shape == (BESTAND.size, n + 1)
+    for zeile, alter in zip(verlauf, BESTAND):
+        if n > 0 and alter + n <= MAX_ALTER:
+            np.testing.assert_allclose(zeile, lbw.nAe_x(int(alter), n, 'M', zins, st), rtol=1e-12, atol=1e-15)
+        else:
+            assert not zeile.any()
+
+
+# =============================================================================
+# Persistenter Cache fuer verlaufswerte_setup
+# =============================================================================
+
+VERLAUF_ARRAYS = ('tpx', 'qx', 'px', 'v_t', 'vt_tpx', 't_array', 'alter_array')
+
+
+def test_verlauf_cache_kalt_warm(st, tmp_path):
+    """Der zweite Aufruf liest die beim ersten geschriebene Datei und liefert identische Arrays."""
+    ohne_cache = bk.verlaufswerte_setup(40, 30, 'M', 0.0175, st)
+    kalt = bk.verlaufswerte_setup(40, 30, 'M', 0.0175, st, cache_dir=tmp_path)
+    cache_datei = bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st)
+    assert cache_datei.exists()
+    assert list(tmp_path.iterdir()) == [cache_datei]
+
+    warm = bk.verlaufswerte_setup(40, 30, 'M', 0.0175, st, cache_dir=tmp_path)
+    for name in VERLAUF_ARRAYS:
+        np.testing.assert_array_equal(getattr(warm, name), getattr(ohne_cache, name))
+        np.testing.assert_array_equal(getattr(kalt, name), getattr(ohne_cache, name))
+        assert getattr(warm, name).dtype == getattr(ohne_cache, name).dtype
+        assert not getattr(warm, name).flags.writeable
+    assert (warm.n, warm.alter, warm.sex, warm.zins) == (30, 40, 'M', 0.0175)
+
+
+def test_verlauf_cache_schluessel(tmp_path):
+    """Zins, Datentyp und Tafel (Pruefsumme) gehen in den Dateinamen ein."""
+    st_1994 = Sterbetafel("DAV1994T", str(DATA_DIR))
+    st_2008 = Sterbetafel("DAV2008T", str(DATA_DIR))
+    assert st_1994.pruefsumme != st_2008.pruefsumme
+
+    dateien = {
+        bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st_1994),
+        bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.02, st_1994),
+        bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st_1994, np.float32),
+        bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st_2008),
+    }
+    assert len(dateien) == 4
+
+    # Rechenrauschen jenseits der 10. Nachkommastelle trifft dieselbe Datei
+    assert (bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175 + 1e-13, st_1994)
+            == bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st_1994))
+
+
+@pytest.mark.parametrize("inhalt", ["abgeschnitten", "leer", "kein_npz"])
+def test_verlauf_cache_defekt(st, tmp_path, inhalt):
+    """Eine defekte Cache-Datei fuehrt zur Neuberechnung statt zu einer Ausnahme."""
+    erwartet = bk.verlaufswerte_setup(40, 30, 'M', 0.0175, st, cache_dir=tmp_path)
+    cache_datei = bk._verlauf_cache_datei(tmp_path, 40, 30, 'M', 0.0175, st)
+
+    daten = cache_datei.read_bytes()
+    cache_datei.write_bytes({"abgeschnitten": daten[:len(daten) // 2],
+                             "leer": b"",
+                             "kein_npz": b"kein zip-archiv"}[inhalt])
+
+    setup = bk.verlaufswerte_setup(40, 30, 'M', 0.0175, st, cache_dir=tmp_path)
+    for name in VERLAUF_ARRAYS:
+        np.testing.assert_array_equal(getattr(setup, name), getattr(erwartet, name))
+
+    # Die Neuberechnung ersetzt die defekte Datei wieder durch eine lesbare
+    assert bk._lade_verlauf_cache(cache_datei) is not None
+
+
+# =============================================================================
+# Einfache Genauigkeit (dtype=np.float32)
+# =============================================================================
+
+@pytest.mark.parametrize("funktion", [lbw.nE_x, lbw.nAe_x, lbw.Ae_xn, lbw.nAe_x_ultra_optimized])
+@pytest.mark.parametrize("n", [21, 60])
+def test_leistungsbarwerte_float32(st, funktion, n):
+    """Die Leistungsbarwerte rechnen mit dtype=np.float32 durchgehend in einfacher Genauigkeit."""
+    werte = funktion(40, n, 'M', 0.0175, st, dtype=np.float32)
+
+    assert werte.dtype == np.float32
+    np.testing.assert_allclose(werte, funktion(40, n, 'M', 0.0175, st), rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("funktion, args", [(rbw.ae_xn, ()), (rbw.ae_xn_k, (12,))])
+def test_rentenbarwerte_float32(st, funktion, args):
+    """ae_xn und ae_xn_k rechnen mit dtype=np.float32 in einfacher Genauigkeit."""
+    werte = funktion(40, 30, 'F', 0.0175, *args, st, dtype=np.float32)
+
+    assert werte.dtype == np.float32
+    np.testing.assert_allclose(werte, funktion(40, 30, 'F', 0.0175, *args, st), rtol=1e-5)
+
+
+def test_tpx_matrix_und_verlaufswerte_setup_float32(st):
+    """tpx_matrix und verlaufswerte_setup liefern mit dtype=np.float32 Vektoren in einfacher Genauigkeit."""
+    tpx = bf.tpx_matrix(40, 60, 'M', st, dtype=np.float32)
+    assert tpx.dtype == np.float32
+    np.testing.assert_allclose(tpx, bf.tpx_matrix(40, 60, 'M', st), rtol=1e-5)
+
+    setup_32 = bk.verlaufswerte_setup(40, 60, 'M', 0.0175, st, dtype=np.float32)
+    setup_64 = bk.verlaufswerte_setup(40, 60, 'M', 0.0175, st)
+    for name in ('tpx', 'qx', 'px', 'v_t', 'vt_tpx'):
+        assert getattr(setup_32, name).dtype == np.float32
+        np.testing.assert_allclose(getattr(setup_32, name), getattr(setup_64, name), rtol=1e-5)
+
+
+def test_kommutationswerte_float32(st):
+    """Kommutationswerte mit dtype=np.float32 speichern und rechnen in einfacher Genauigkeit."""
+    kw_32 = Kommutationswerte(st, 0.0175, dtype=np.float32)
+    kw_64 = Kommutationswerte(st, 0.0175)
+
+    for name in ('lx', 'Dx', 'Nx', 'Mx'):
+        vektor = kw_32._get_kommutationswerte('M')[name]
+        assert vektor.dtype == np.float32
+        np.testing.assert_allclose(vektor[:111], kw_64._get_kommutationswerte('M')[name][:111], rtol=1e-5)
+
+    for alter in (0, 40, 80):
+        for wert_32, wert_64 in ((kw_32.ax_k(alter, 'M', 12), kw_64.ax_k(alter, 'M', 12)),
+                                 (kw_32.axn_k(alter, 20, 'M', 12), kw_64.axn_k(alter, 20, 'M', 12)),
+                                 (kw_32.nAx(alter, 20, 'M'), kw_64.nAx(alter, 20, 'M')),
+                                 (kw_32.nEx(alter, 20, 'M'), kw_64.nEx(alter, 20, 'M'))):
+            assert np.asarray(wert_32).dtype == np.float32
+            np.testing.assert_allclose(wert_32, wert_64, rtol=1e-5)